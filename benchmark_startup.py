@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for Mindseye
+Measures import cost of the entry points and time from launch to a served dashboard.
+
+Usage:
+    python benchmark_startup.py [--runs 5] [--budget 1.0]
+"""
+
+import argparse
+import re
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+ENTRY_MODULES = ["mindseye_config", "mindseye_cli", "web_server", "evidence_compiler"]
+
+
+def import_time_ms(module):
+    """Cumulative import time of a module in a fresh interpreter, per `python -X importtime`."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    for line in reversed(result.stderr.splitlines()):
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \| " + re.escape(module) + r"$", line)
+        if match:
+            return int(match.group(1)) / 1000
+    raise RuntimeError(f"No import time reported for {module}")
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("localhost", 0))
+        return s.getsockname()[1]
+
+
+def launch_to_dashboard(workdir, timeout=30.0):
+    """Seconds from starting start_mindseye.py until GET / answers 200."""
+    port = free_port()
+    started = time.perf_counter()
+    process = subprocess.Popen([sys.executable, str(ROOT / "start_mindseye.py"),
+                                "--port", str(port), "--no-browser"],
+                               cwd=workdir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while time.perf_counter() - started < timeout:
+            try:
+                with urllib.request.urlopen(f"http://localhost:{port}/", timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - started
+            except OSError:
+                if process.poll() is not None:
+                    raise RuntimeError("start_mindseye.py exited before serving the dashboard")
+                time.sleep(0.005)
+        raise RuntimeError(f"Dashboard not served within {timeout}s")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mindseye startup benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="Launches to time")
+    parser.add_argument("--budget", type=float, default=1.0,
+                        help="Fail if the median launch-to-dashboard time exceeds this many seconds")
+    args = parser.parse_args()
+
+    print("⏱️  Mindseye Startup Benchmark")
+    print("=" * 50)
+
+    print("📦 Import time (python -X importtime, cumulative):")
+    for module in ENTRY_MODULES:
+        print(f"  {module:<20} {import_time_ms(module):7.1f} ms")
+
+    # Launch in a scratch directory holding a copy of the example evidence
+    with tempfile.TemporaryDirectory() as workdir:
+        shutil.copytree(ROOT / "example_evidence", Path(workdir) / "evidence")
+        shutil.copy(ROOT / "index.html", workdir)
+
+        timings = [launch_to_dashboard(workdir) for _ in range(args.runs)]
+
+    median = statistics.median(timings)
+    print(f"🚀 Launch to served dashboard: median {median * 1000:.0f} ms, "
+          f"first {timings[0] * 1000:.0f} ms (compile), best {min(timings) * 1000:.0f} ms")
+    if median > args.budget:
+        print(f"❌ Slower than the {args.budget:.2f}s budget")
+        sys.exit(1)
+    print(f"✅ Within the {args.budget:.2f}s budget")
+
+
+if __name__ == "__main__":
+    main()
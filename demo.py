@@ -4,14 +4,19 @@ Mindseye Evidence Compiler - Demo Script
 Demonstrates the system capabilities with example data.
 """
 
-import subprocess
-import time
-import webbrowser
-import os
+import argparse
+import json
 from pathlib import Path
 
+from mindseye_cli import run
+
 def main():
     """Run the Mindseye demo."""
+    parser = argparse.ArgumentParser(description="Mindseye Evidence Compiler - Demo")
+    parser.add_argument("--port", type=int, default=8080, help="Port to serve the dashboard on")
+    parser.add_argument("--no-browser", action="store_true", help="Do not open a browser")
+    args = parser.parse_args()
+    
     print("🧠 Mindseye Evidence Compiler - Interactive Demo")
     print("=" * 60)
     
@@ -22,23 +27,17 @@ def main():
         print("💡 Run 'python mindseye_cli.py init' first")
         return
     
-    # Compile example evidence
+    # Compile example evidence (each step runs in this process)
     print("🔍 Compiling example evidence...")
-    result = subprocess.run([
-        "python", "mindseye_cli.py", "compile", 
-        "--evidence-root", "example_evidence", "--output-dir", "."
-    ], capture_output=True, text=True)
-    
-    if result.returncode == 0:
+    if run(["compile", "--evidence-root", "example_evidence", "--output-dir", "."]) == 0:
         print("✅ Evidence compiled successfully!")
     else:
-        print("❌ Compilation failed:")
-        print(result.stderr)
+        print("❌ Compilation failed. Check compiler.log for details.")
         return
     
     # Show statistics
     print("\n📊 Current Statistics:")
-    subprocess.run(["python", "mindseye_cli.py", "stats", "--evidence-root", "example_evidence"])
+    run(["stats", "--evidence-root", "example_evidence"])
     
     # Show example files
     print("\n📁 Example Evidence Files:")
@@ -54,7 +53,6 @@ def main():
     # Show bubble data
     print("\n🎈 Generated Bubbles:")
     try:
-        import json
         with open("bubbles.json", "r") as f:
             bubbles = json.load(f)
         
@@ -68,28 +66,17 @@ def main():
     
     # Start web server
     print("🌐 Starting web interface...")
-    print("📱 The web interface will open in your browser")
+    if not args.no_browser:
+        print("📱 The web interface will open in your browser")
     print("⏹️  Press Ctrl+C to stop the demo")
     print("-" * 60)
     
-    try:
-        # Open browser after a short delay
-        def open_browser():
-            time.sleep(3)
-            webbrowser.open("http://localhost:8080")
-        
-        import threading
-        browser_thread = threading.Thread(target=open_browser)
-        browser_thread.daemon = True
-        browser_thread.start()
-        
-        # Start the web server
-        subprocess.run(["python", "mindseye_cli.py", "serve", "--port", "8080"])
-        
-    except KeyboardInterrupt:
-        print("\n🛑 Demo stopped by user")
-    except Exception as e:
-        print(f"❌ Error starting demo: {e}")
+    serve_args = ["serve", "--port", str(args.port)]
+    if not args.no_browser:
+        # Opened as soon as the server is listening
+        serve_args.append("--open")
+    if run(serve_args) != 0:
+        print("❌ Error starting demo")
 
 if __name__ == "__main__":
     main()
@@ -13,65 +13,292 @@ import csv
 import hashlib
 import re
 import random
+import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from log_index import AuditLogIndex, LOG_FIELDS, format_digests, upgrade_log_schema
+from mindseye_config import hash_algorithms, load_config
+from mindseye_logging import ProgressReporter, setup_logging
+from merkle import publish_root
+from tagging import TAG_INDEX_FILENAME, load_tagger, update_tag_index
+from timeline import DATE_EXTRACTION_VERSION, TIMELINE_FILENAME, extract_incident_date, update_timeline
+from result_cache import ResultCache, CACHE_FILENAME, DEFAULT_MAX_BYTES
+from sharding import shard_of, shard_suffix
+from extractors import (DEFAULT_MEMORY_LIMIT, DEFAULT_TIMEOUT, EXTRACTOR_REQUIREMENTS, STREAMING_EXTRACTORS,
+                        ExtractorPool, extract_text, extractor_id, is_expensive, supported_extensions,
+                        supports_streaming)
+from segmentation import iter_lines, iter_segments
+
+STATS_FILENAME = "compiler_stats.json"
+CHECKPOINT_INTERVAL = 100
+CHECKPOINT_SECONDS = 30.0
+
+# Image formats linked to bubbles, in order of preference when several share a name
+IMAGE_EXTENSIONS = ['.png', '.jpg', '.jpeg', '.gif', '.webp', '.svg', '.bmp']
+THUMBNAIL_DIR = "thumbnails"
+THUMBNAIL_SIZE = (128, 128)
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Distinct URLs kept per bubble of a segmented file, so its bubbles stay small
+MAX_SEGMENT_URLS = 100
+# Small sections are merged so a segmented file has about this many bubbles at most
+MAX_SEGMENTS_PER_FILE = 1000
+
+# Extensions already warned about as having no extractor (once per process)
+_warned_unsupported = set()
+
+
+def hash_file(file_path, algorithms: List[str]) -> Dict[str, str]:
+    """Compute several hashlib digests of a file in a single read pass."""
+    hashers = {algorithm: hashlib.new(algorithm) for algorithm in algorithms}
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            for hasher in hashers.values():
+                hasher.update(chunk)
+    return {algorithm: hasher.hexdigest() for algorithm, hasher in hashers.items()}
+
+
+def _write_json_atomic(path: Path, data: Any, indent: Optional[int] = 2):
+    """Write JSON to a temporary sibling file and atomically move it into place."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=indent, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_stats_sidecar(output_dir: str = ".", suffix: str = "") -> Dict[str, Any]:
+    """Load the stats sidecar maintained by the compiler, or {} if absent."""
+    try:
+        with open(Path(output_dir) / f"compiler_stats{suffix}.json", 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def rebuild_stats_sidecar(output_dir: str = ".", evidence_root: str = "/evidence",
+                          suffix: str = "") -> Dict[str, Any]:
+    """
+    Rebuild the stats sidecar from existing outputs.
+
+    Used once for output directories compiled before the sidecar existed;
+    afterwards the compiler keeps it up to date incrementally.
+    """
+    output_dir = Path(output_dir)
+    evidence_root = Path(evidence_root)
+    sidecar = {
+        "total_bubbles": 0,
+        "total_processed_files": 0,
+        "total_bytes": 0,
+        "extensions": {},
+    }
+
+    bubbles_file = output_dir / f"bubbles{suffix}.json"
+    if bubbles_file.exists():
+        try:
+            with open(bubbles_file, 'r', encoding='utf-8') as f:
+                sidecar["total_bubbles"] = len(json.load(f))
+        except (OSError, ValueError):
+            pass
+
+    log_file = output_dir / f"compiler_log{suffix}.csv"
+    if log_file.exists():
+        try:
+            seen = set()
+            with open(log_file, 'r', encoding='utf-8') as f:
+                for row in csv.DictReader(f):
+                    filename = row['filename']
+                    sidecar["last_compilation"] = row.get('timestamp', 'Unknown')
+                    if filename in seen:
+                        continue
+                    seen.add(filename)
+                    file_path = evidence_root / filename
+                    size = file_path.stat().st_size if file_path.is_file() else 0
+                    _add_to_stats(sidecar, file_path.suffix, size)
+        except (OSError, KeyError):
+            pass
+
+    try:
+        _write_json_atomic(output_dir / f"compiler_stats{suffix}.json", sidecar)
+    except OSError:
+        pass
+    return sidecar
+
+
+def _add_to_stats(sidecar: Dict[str, Any], extension: str, size: int):
+    """Account for one newly processed file in the stats sidecar."""
+    extension = extension.lower() or "(none)"
+    sidecar["total_processed_files"] = sidecar.get("total_processed_files", 0) + 1
+    sidecar["total_bytes"] = sidecar.get("total_bytes", 0) + size
+    breakdown = sidecar.setdefault("extensions", {}).setdefault(extension, {"files": 0, "bytes": 0})
+    breakdown["files"] += 1
+    breakdown["bytes"] += size
+
+
+def _bubble_key(bubble: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Identity of a bubble: its file, plus the segment for children of segmented files."""
+    if "parent" in bubble:
+        return ("segment", bubble["parent"], bubble["segment"]["index"])
+    if "path" in bubble:
+        return ("file", bubble["path"])
+    # Bubbles compiled before they recorded a path
+    return ("untracked", bubble.get("title"), bubble.get("createdDate"), bubble.get("createdTime"))
+
+
+def read_compilation_stats(output_dir: str = ".", evidence_root: str = "/evidence") -> Dict[str, Any]:
+    """
+    Read compilation statistics from the stats sidecar.
+
+    This never parses bubbles.json or the CSV log, so it is cheap enough to
+    call on every dashboard poll.
+    """
+    output_dir = Path(output_dir)
+    bubbles_file = output_dir / "bubbles.json"
+    log_file = output_dir / "compiler_log.csv"
+
+    sidecar = load_stats_sidecar(output_dir)
+    if not sidecar and (bubbles_file.exists() or log_file.exists()):
+        sidecar = rebuild_stats_sidecar(output_dir, evidence_root)
+
+    stats = {
+        "total_processed_files": sidecar.get("total_processed_files", 0),
+        "bubbles_file_exists": bubbles_file.exists(),
+        "log_file_exists": log_file.exists(),
+        "evidence_root_exists": Path(evidence_root).exists()
+    }
+
+    if stats["bubbles_file_exists"]:
+        stats["total_bubbles"] = sidecar.get("total_bubbles", 0)
+
+    for key in ("total_bytes", "last_run", "last_run_duration", "last_compilation", "extensions",
+                "merkle_root"):
+        if key in sidecar:
+            stats[key] = sidecar[key]
+
+    return stats
+
 
 class MindseyeEvidenceCompiler:
     """Main class for compiling evidence files into Mindseye bubble format."""
     
-    def __init__(self, evidence_root: str = "/evidence", output_dir: str = "."):
+    def __init__(self, evidence_root: str = "/evidence", output_dir: str = ".",
+                 use_cache: bool = True, cache_max_bytes: int = DEFAULT_MAX_BYTES,
+                 shard: Optional[Tuple[int, int]] = None,
+                 checkpoint_interval: int = CHECKPOINT_INTERVAL,
+                 checkpoint_seconds: float = CHECKPOINT_SECONDS,
+                 supported_file_types: Optional[List[str]] = None,
+                 extract_workers: Optional[int] = None,
+                 extract_timeout: float = DEFAULT_TIMEOUT,
+                 extract_memory_limit: Optional[int] = DEFAULT_MEMORY_LIMIT,
+                 config: Optional[Dict[str, Any]] = None):
         """
         Initialize the evidence compiler.
         
         Args:
             evidence_root: Root directory to scan for evidence files
             output_dir: Directory to output compiled files
+            use_cache: Reuse extraction results for content seen before
+            cache_max_bytes: Size bound for the result cache
+            shard: Optional (index, count) to compile only one partition of
+                the evidence tree into shard-suffixed outputs
+            checkpoint_interval: Files processed between journal checkpoints
+            checkpoint_seconds: Maximum time between journal checkpoints
+            supported_file_types: Extensions to compile (default: config.json)
+            extract_workers: Worker processes for expensive extractors
+            extract_timeout: Seconds allowed per file in the worker pool
+            extract_memory_limit: Memory cap per worker process in bytes
+            config: Validated configuration (default: config.json via load_config)
         """
+        self.config = config or load_config()
+        self.bubble_settings = self.config["bubble_settings"]
+        self.compilation_settings = self.config["compilation_settings"]
+        self.hash_algorithms = hash_algorithms(self.config)
+        self._tagger = None
         self.evidence_root = Path(evidence_root)
         self.output_dir = Path(output_dir)
-        self.log_file = self.output_dir / "compiler_log.csv"
-        self.bubbles_file = self.output_dir / "bubbles.json"
+        self.shard = shard
+        self.output_suffix = shard_suffix(shard)
+        self.log_file = self.output_dir / f"compiler_log{self.output_suffix}.csv"
+        self.bubbles_file = self.output_dir / f"bubbles{self.output_suffix}.json"
+        self.stats_file = self.output_dir / f"compiler_stats{self.output_suffix}.json"
+        self.journal_file = self.output_dir / f"compile_journal{self.output_suffix}.jsonl"
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoint_seconds = checkpoint_seconds
+        self._pending_rows = []
+        self._run_id = None
+        self._checkpoints = 0
+        self._image_index = None
+        
+        # Extractors
+        file_types = supported_file_types or self.config["supported_file_types"]
+        self.supported_file_types = supported_extensions(file_types)
+        self.extract_workers = extract_workers
+        self.extract_timeout = extract_timeout
+        self.extract_memory_limit = extract_memory_limit
+        self._extractor_pool = None
+        cache_name = Path(CACHE_FILENAME)
+        self.cache_file = self.output_dir / f"{cache_name.stem}{self.output_suffix}{cache_name.suffix}"
+        self.use_cache = use_cache
+        self.cache_max_bytes = cache_max_bytes
+        self.cache = None
         self.processed_files = set()
         
-        # Setup logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(self.output_dir / "compiler.log"),
-                logging.StreamHandler()
-            ]
-        )
-        self.logger = logging.getLogger(__name__)
+        # Records are queued and written by a background listener
+        self.logger = setup_logging(self.config["logging"], self.output_dir).getChild("compiler")
+        for extension in sorted(set(file_types) - set(self.supported_file_types) - _warned_unsupported):
+            _warned_unsupported.add(extension)
+            requirement = EXTRACTOR_REQUIREMENTS.get(extension.lower())
+            hint = f" (install the optional '{requirement}' package)" if requirement else ""
+            self.logger.warning(f"No extractor available for {extension} files; they will be skipped{hint}")
         
         # Load existing processed files
         self._load_processed_files()
     
     def _load_processed_files(self):
-        """Load previously processed files from the log."""
-        if self.log_file.exists():
+        """Load previously processed files from the log (and the merged log when sharded)."""
+        log_files = [self.log_file]
+        if self.shard:
+            log_files.append(self.output_dir / "compiler_log.csv")
+        
+        for log_file in log_files:
+            if not log_file.exists():
+                continue
             try:
-                with open(self.log_file, 'r', encoding='utf-8') as f:
+                with open(log_file, 'r', encoding='utf-8') as f:
                     reader = csv.DictReader(f)
                     for row in reader:
                         self.processed_files.add(row['filename'])
-                self.logger.info(f"Loaded {len(self.processed_files)} previously processed files")
             except Exception as e:
-                self.logger.warning(f"Could not load processed files log: {e}")
+                self.logger.warning(f"Could not load processed files log {log_file}: {e}")
+        if self.processed_files:
+            self.logger.info(f"Loaded {len(self.processed_files)} previously processed files")
     
-    def _calculate_file_hash(self, file_path: Path) -> str:
-        """Calculate SHA-256 hash of a file."""
-        hash_sha256 = hashlib.sha256()
+    def _calculate_file_digests(self, file_path: Path) -> Dict[str, str]:
+        """Calculate every configured hash of a file in one pass ({} on error)."""
         try:
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_sha256.update(chunk)
-            return hash_sha256.hexdigest()
+            return hash_file(file_path, self.hash_algorithms)
         except Exception as e:
             self.logger.error(f"Error calculating hash for {file_path}: {e}")
-            return ""
+            return {}
+    
+    def _calculate_file_hash(self, file_path: Path) -> str:
+        """Calculate the primary configured hash (SHA-256 by default) of a file."""
+        return self._calculate_file_digests(file_path).get(self.hash_algorithms[0], "")
+    
+    def _cache_key(self, file_hash: str, extension: str) -> str:
+        """
+        Result cache key: the content hash plus the extractor that turns it into text.
+        
+        Identical bytes saved as .txt and .html extract differently, so they
+        must not share an entry. Non-SHA-256 hashes are namespaced by algorithm.
+        """
+        algorithm = self.hash_algorithms[0]
+        key = file_hash if algorithm == "sha256" else f"{algorithm}:{file_hash}"
+        return f"{key}:{extractor_id(extension)}"
     
     def _extract_urls(self, content: str) -> List[Dict[str, str]]:
         """Extract URLs from file content."""
@@ -105,64 +332,182 @@ class MindseyeEvidenceCompiler:
         lightness = random.uniform(60, 80)
         return f"hsl({hue:.2f}, {saturation:.1f}%, {lightness:.1f}%)"
     
+    def _index_images(self) -> Dict[str, str]:
+        """List the images/ directory once, mapping file stem to image filename."""
+        index = {}
+        try:
+            with os.scandir(self.evidence_root / "images") as entries:
+                for entry in entries:
+                    stem, extension = os.path.splitext(entry.name)
+                    extension = extension.lower()
+                    if extension not in IMAGE_EXTENSIONS or not entry.is_file():
+                        continue
+                    current = index.get(stem)
+                    if current is None or (IMAGE_EXTENSIONS.index(extension)
+                                           < IMAGE_EXTENSIONS.index(os.path.splitext(current)[1].lower())):
+                        index[stem] = entry.name
+        except OSError:
+            pass
+        return index
+    
     def _check_for_image(self, filename: str) -> str:
         """Check if corresponding image exists in images/ directory."""
-        image_path = self.evidence_root / "images" / f"{filename}.png"
-        if image_path.exists():
-            return f"images/{filename}.png"
+        if self._image_index is None:
+            self._image_index = self._index_images()
+        image_name = self._image_index.get(filename)
+        if image_name:
+            return f"images/{image_name}"
         return ""
     
-    def _create_bubble(self, file_path: Path, content: str) -> Dict[str, Any]:
-        """Create a bubble object from file data."""
+    def _create_thumbnail(self, image: str) -> str:
+        """
+        Create (or reuse) a downscaled copy of a bubble image for the bubble view.
+        
+        Thumbnails are cached under thumbnails/ in the output directory and
+        regenerated only when the source image changes. Requires Pillow;
+        without it bubbles simply have no thumbnail.
+        """
+        source = self.evidence_root / image
+        if source.suffix.lower() == '.svg':
+            return ""
+        extension = '.jpg' if source.suffix.lower() in ('.jpg', '.jpeg') else '.png'
+        relative = f"{THUMBNAIL_DIR}/{source.stem}{extension}"
+        target = self.output_dir / relative
+        
+        try:
+            if target.exists() and target.stat().st_mtime >= source.stat().st_mtime:
+                return relative
+            try:
+                from PIL import Image
+            except ImportError:
+                return ""
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with Image.open(source) as img:
+                img.thumbnail(THUMBNAIL_SIZE)
+                if extension == '.jpg':
+                    img = img.convert('RGB')
+                img.save(target)
+            return relative
+        except Exception as e:
+            self.logger.warning(f"Could not create thumbnail for {source}: {e}")
+            return ""
+    
+    @property
+    def tagger(self):
+        """Tagger for the configured dictionaries, built on first use."""
+        if self._tagger is None:
+            self._tagger = load_tagger(self.compilation_settings["tag_dictionaries"])
+            self.logger.info(f"Loaded {len(self._tagger)} tag dictionary terms")
+        return self._tagger
+    
+    def _feature_settings(self) -> Dict[str, Any]:
+        """Settings that affect extracted features; cached features must match them."""
+        return {
+            "max_description_length": self.compilation_settings["max_description_length"],
+            "enable_url_extraction": self.compilation_settings["enable_url_extraction"],
+            "tag_dictionaries": self.tagger.signature,
+            "date_extraction": DATE_EXTRACTION_VERSION
+        }
+    
+    def _extract_features(self, content: str) -> Dict[str, Any]:
+        """Derive the content-dependent parts of a bubble (cacheable by hash)."""
+        limit = self.compilation_settings["max_description_length"]
+        return {
+            "description": content[:limit] + "..." if len(content) > limit else content,
+            "urls": self._extract_urls(content) if self.compilation_settings["enable_url_extraction"] else [],
+            "length": len(content),
+            "tags": self.tagger.tag(content),
+            "incident_date": extract_incident_date(content),
+            "settings": self._feature_settings()
+        }
+    
+    def _create_bubble(self, file_path: Path, features: Dict[str, Any],
+                       segment: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Create a bubble object from file data.
+        
+        With a segment (from segmentation.iter_segments) the bubble is a child
+        of the file's bubble: it has a 'parent' path and 'segment' details
+        instead of a 'path', and no image.
+        """
         filename = file_path.stem
         x, y, vx, vy = self._generate_random_position()
         
-        # Extract URLs from content
-        urls = self._extract_urls(content)
-        
         # Check for image
-        image = self._check_for_image(filename)
+        image = ""
+        if segment is None and self.compilation_settings["enable_image_linking"]:
+            image = self._check_for_image(filename)
+        thumbnail = self._create_thumbnail(image) if image else ""
         
         # Get current date and time
+        settings = self.bubble_settings
         now = datetime.now()
         created_date = now.strftime("%Y-%m-%d")
         created_time = now.strftime("%H:%M:%S")
         
+        # When the incident happened: from the content, else the file's modification date
+        incident_date = features.get("incident_date")
+        incident_date_source = "content"
+        if not incident_date:
+            incident_date = datetime.fromtimestamp(file_path.stat().st_mtime).strftime("%Y-%m-%d")
+            incident_date_source = "file_modified"
+        
         bubble = {
             "title": filename,
-            "description": content[:500] + "..." if len(content) > 500 else content,
+            "path": str(file_path.relative_to(self.evidence_root)),
+            "description": features["description"],
             "x": x,
             "y": y,
             "vx": vx,
             "vy": vy,
             "color": self._generate_random_color(),
-            "textColor": "yellow",
-            "radius": 28,
-            "font": "Trebuchet MS",
+            "textColor": settings["textColor"],
+            "radius": settings["radius"],
+            "font": settings["font"],
             "image": image,
-            "glow": True,
-            "fontSize": 8,
+            "thumbnail": thumbnail,
+            "glow": settings["glow"],
+            "fontSize": settings["fontSize"],
             "rotation": 0,
-            "fixed": True,
-            "static": True,
-            "shape": "circle",
+            "fixed": settings["fixed"],
+            "static": settings["static"],
+            "shape": settings["shape"],
             "heightRatio": 1,
             "showPauseBorder": False,
             "createdDate": created_date,
             "createdTime": created_time,
+            "incidentDate": incident_date,
+            "incidentDateSource": incident_date_source,
             "goals": 0,
             "flashUntil": 0,
             "goalCooldown": 0,
             "ballVelocityBoost": 0,
             "ballVelocityDecay": 0,
             "attachments": [],
-            "urls": urls
+            "urls": features["urls"],
+            "tags": features["tags"]
         }
         
+        if segment is not None:
+            heading = segment["heading"]
+            title = f"{filename} - {heading}" if heading else \
+                f"{filename} - lines {segment['line_start']}-{segment['line_end']}"
+            if segment["part"] > 1:
+                title += f" (part {segment['part']})"
+            bubble["title"] = title
+            bubble["parent"] = bubble.pop("path")
+            bubble["segment"] = {
+                "index": segment["index"],
+                "heading": heading,
+                "part": segment["part"],
+                "lineStart": segment["line_start"],
+                "lineEnd": segment["line_end"]
+            }
+        
         return bubble
     
     def _scan_evidence_files(self) -> List[Path]:
-        """Scan evidence directory for .txt and .md files."""
+        """Scan evidence directory for files of the supported types."""
         evidence_files = []
         
         if not self.evidence_root.exists():
@@ -170,59 +515,307 @@ class MindseyeEvidenceCompiler:
             return evidence_files
         
         for file_path in self.evidence_root.rglob("*"):
-            if file_path.is_file() and file_path.suffix.lower() in ['.txt', '.md']:
+            if file_path.is_file() and file_path.suffix.lower() in self.supported_file_types:
+                if self.shard and shard_of(file_path.relative_to(self.evidence_root), self.shard[1]) != self.shard[0]:
+                    continue
                 evidence_files.append(file_path)
         
         self.logger.info(f"Found {len(evidence_files)} evidence files")
         return evidence_files
     
-    def _process_file(self, file_path: Path) -> Optional[Dict[str, Any]]:
-        """Process a single evidence file."""
+    def _start_file(self, file_path: Path) -> Dict[str, Any]:
+        """
+        Begin processing a file.
+        
+        Hashes the file, looks the hash up in the result cache and, on a
+        miss for an expensive format, starts extraction in the worker pool.
+        """
+        task = {"path": file_path, "hash": "", "digests": {}, "features": None, "pending": None,
+                "segmented": False, "error": None}
         try:
-            # Calculate file hash
-            file_hash = self._calculate_file_hash(file_path)
-            if not file_hash:
-                return None
+            if self._is_large_file(file_path):
+                # Hashed in the same single pass that reads its segments
+                task["segmented"] = True
+                return task
+            digests = self._calculate_file_digests(file_path)
+            task["hash"] = digests.pop(self.hash_algorithms[0], "")
+            task["digests"] = digests
+            if task["hash"]:
+                # Reuse results for content we have already seen
+                features = self.cache.get(self._cache_key(task["hash"], file_path.suffix)) if self.cache else None
+                if features and features.get("settings") == self._feature_settings():
+                    task["features"] = features
+                if task["features"] is None and is_expensive(file_path.suffix):
+                    if self._extractor_pool is None:
+                        self._extractor_pool = ExtractorPool(self.extract_workers, self.extract_timeout,
+                                                             self.extract_memory_limit)
+                    task["pending"] = self._extractor_pool.submit(file_path)
+        except Exception as e:
+            task["error"] = e
+        return task
+    
+    def _finish_file(self, task: Dict[str, Any],
+                     emit_child: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+        """
+        Complete processing started by _start_file and return the file's bubbles ([] on failure).
+        
+        For a segmented file, emit_child (if given) receives each child
+        bubble as soon as it is made and only the parent is returned.
+        """
+        file_path = task["path"]
+        try:
+            if task["error"]:
+                raise task["error"]
+            if task["segmented"]:
+                return self._finish_segmented_file(file_path, emit_child)
+            if not task["hash"]:
+                return []
             
-            # Read file content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            features = task["features"]
+            if features is None:
+                if task["pending"]:
+                    content = task["pending"].result()
+                else:
+                    content = extract_text(file_path)
+                features = self._extract_features(content)
+                if self.cache:
+                    self.cache.put(self._cache_key(task["hash"], file_path.suffix), features)
             
             # Create bubble
-            bubble = self._create_bubble(file_path, content)
+            bubble = self._create_bubble(file_path, features)
             
             # Log the processing
-            self._log_file_processing(file_path, file_hash)
+            self._log_file_processing(file_path, task["hash"], task["digests"])
             
-            return bubble
+            return [bubble]
             
         except Exception as e:
             self.logger.error(f"Error processing file {file_path}: {e}")
-            return None
+            return []
+    
+    def _is_large_file(self, file_path: Path) -> bool:
+        """Whether a file is big enough (and of a streamable type) to be ingested in segments."""
+        threshold = self.compilation_settings["large_file_threshold_mb"] * 1024 * 1024
+        return supports_streaming(file_path.suffix) and file_path.stat().st_size >= threshold
     
-    def _log_file_processing(self, file_path: Path, file_hash: str):
-        """Log file processing to CSV."""
+    def _finish_segmented_file(self, file_path: Path,
+                               emit_child: Optional[Callable[[Dict[str, Any]], None]] = None
+                               ) -> List[Dict[str, Any]]:
+        """
+        Ingest a large file as a parent bubble plus one child bubble per segment.
+        
+        The file is read once, in fixed-size chunks, and split at headings
+        (segmentation.iter_segments). The whole-file digests and every
+        segment's description, URLs, tags and date come from that one pass,
+        so peak memory depends on max_segment_chars rather than file size.
+        Sections shorter than min_segment_chars are merged, and more so in
+        files big enough to exceed MAX_SEGMENTS_PER_FILE.
+        The result cache is not consulted: looking it up needs the hash,
+        which would cost a second read of the file.
+        
+        Children are passed to emit_child as they are made and only the
+        parent is returned; without emit_child they are returned after it.
+        """
+        max_chars = self.compilation_settings["max_segment_chars"]
+        min_chars = min(max_chars, max(self.compilation_settings["min_segment_chars"],
+                                       file_path.stat().st_size // MAX_SEGMENTS_PER_FILE))
+        hashers = {algorithm: hashlib.new(algorithm) for algorithm in self.hash_algorithms}
+        extractor = STREAMING_EXTRACTORS[file_path.suffix.lower()]
+        lines = extractor(iter_lines(file_path, hashers, max_line_chars=max_chars))
+        
+        def add_urls(kept, seen, urls):
+            for url in urls:
+                if len(kept) >= MAX_SEGMENT_URLS:
+                    break
+                if url["href"] not in seen:
+                    seen.add(url["href"])
+                    kept.append(url)
+        
+        children = []
+        emit = emit_child or children.append
+        count = 0
+        summary = {"description": None, "urls": [], "length": 0, "tags": set(), "incident_date": None}
+        seen_urls = set()
+        for segment in iter_segments(lines, max_chars, min_chars):
+            features = self._extract_features(segment["text"])
+            urls, features["urls"] = features["urls"], []
+            add_urls(features["urls"], set(), urls)
+            add_urls(summary["urls"], seen_urls, features["urls"])
+            if summary["description"] is None:
+                summary["description"] = features["description"]
+            summary["length"] += features["length"]
+            summary["tags"].update(features["tags"])
+            summary["incident_date"] = summary["incident_date"] or features["incident_date"]
+            emit(self._create_bubble(file_path, features, segment))
+            count += 1
+        
+        digests = {algorithm: hasher.hexdigest() for algorithm, hasher in hashers.items()}
+        file_hash = digests.pop(self.hash_algorithms[0])
+        summary["description"] = summary["description"] or ""
+        summary["tags"] = sorted(summary["tags"])
+        parent = self._create_bubble(file_path, summary)
+        parent["segments"] = count
+        self.logger.info(f"Ingested {file_path.name} in {count} segments")
+        
+        self._log_file_processing(file_path, file_hash, digests)
+        return [parent] + children
+    
+    def _process_file(self, file_path: Path) -> List[Dict[str, Any]]:
+        """Process a single evidence file."""
+        return self._finish_file(self._start_file(file_path))
+    
+    def _log_file_processing(self, file_path: Path, file_hash: str, digests: Optional[Dict[str, str]] = None):
+        """
+        Queue a CSV log row for the file; rows are written at the next checkpoint.
+        
+        The row records which algorithm produced the hash, plus any secondary
+        digests, so ledgers spanning algorithm changes can still be verified.
+        """
         now = datetime.now()
         timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
         
+        self._pending_rows.append([
+            str(file_path.relative_to(self.evidence_root)),
+            file_hash,
+            timestamp,
+            'processed',
+            self.hash_algorithms[0],
+            format_digests(digests or {})
+        ])
+    
+    def _write_log_rows(self, rows: List[List[str]]):
+        """Append rows to the CSV log and flush them to disk."""
         # Ensure log file exists with headers
         log_exists = self.log_file.exists()
         
         with open(self.log_file, 'a', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
             if not log_exists:
-                writer.writerow(['filename', 'hash', 'timestamp', 'status'])
+                # A fresh log invalidates any byte-offset index left behind
+                stale_index = AuditLogIndex(self.log_file).index_file
+                if stale_index.exists():
+                    stale_index.unlink()
+                writer.writerow(LOG_FIELDS)
             
-            writer.writerow([
-                str(file_path.relative_to(self.evidence_root)),
-                file_hash,
-                timestamp,
-                'processed'
-            ])
+            writer.writerows(rows)
+            f.flush()
+            os.fsync(f.fileno())
+    
+    def _checkpoint(self, batch_bubbles: List[Dict[str, Any]], batch_sizes: List[List[Any]]):
+        """
+        Commit a batch of bubbles and their log rows.
+        
+        The batch is first appended to the write-ahead journal and fsynced;
+        only then are the rows added to the CSV log. A file therefore never
+        appears in the log unless its bubble has been durably recorded.
+        A batch may hold the first children of a segmented file whose row
+        comes in a later checkpoint.
+        """
+        if not self._pending_rows and not batch_bubbles:
+            return
+        
+        journal_exists = self.journal_file.exists()
+        with open(self.journal_file, 'a', encoding='utf-8') as f:
+            if not journal_exists:
+                f.write(json.dumps({"run_id": self._run_id}) + "\n")
+            f.write(json.dumps({
+                "bubbles": batch_bubbles,
+                "rows": self._pending_rows,
+                "sizes": batch_sizes
+            }, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        
+        self._checkpoints += 1
+        if self._pending_rows:
+            self._write_log_rows(self._pending_rows)
+        if self.cache:
+            self.cache.commit()
+        
+        self.logger.info(f"Checkpoint: {len(self._pending_rows)} files, {len(batch_bubbles)} bubbles committed")
+        self._pending_rows = []
+        del batch_bubbles[:]
+        del batch_sizes[:]
+    
+    def _recover_journal(self, sidecar: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Recover the checkpointed work of an interrupted run.
+        
+        Returns the journaled bubbles, replays any journaled log rows that
+        did not reach the CSV log, and marks their files as processed so
+        the resumed run continues where the last checkpoint left off.
+        Checkpoints the stats sidecar had not yet recorded (see _save_stats)
+        are added to it.
+        """
+        if not self.journal_file.exists():
+            return []
+        
+        header = None
+        bubbles = []
+        replay_rows = []
+        checkpoints = 0
+        valid_bytes = 0
+        # A sidecar rebuilt from the CSV log already counts every logged row
+        journaled = sidecar.get("journal")
+        counted = journaled["checkpoints"] if journaled else None
+        with open(self.journal_file, 'rb') as f:
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("unterminated line")
+                    entry = json.loads(line)
+                except ValueError:
+                    break  # torn write at the crash point; later lines can't exist
+                valid_bytes += len(line)
+                if header is None:
+                    header = entry
+                    if journaled and journaled["run_id"] != header["run_id"]:
+                        counted = 0
+                    continue
+                bubbles.extend(entry["bubbles"])
+                for row, (extension, size) in zip(entry["rows"], entry["sizes"]):
+                    replay = row[0] not in self.processed_files
+                    if replay:
+                        replay_rows.append(row)
+                        self.processed_files.add(row[0])
+                    if replay if counted is None else checkpoints >= counted:
+                        _add_to_stats(sidecar, extension, size)
+                checkpoints += 1
+        
+        if header is None:
+            self.journal_file.unlink()
+            return []
+        
+        # Children of a segmented file that was cut off before its row was journaled;
+        # the file is processed again from the start
+        bubbles = [bubble for bubble in bubbles
+                   if "parent" not in bubble or bubble["parent"] in self.processed_files]
+        
+        # Drop the torn fragment, or the next checkpoint would be appended to it
+        if valid_bytes < self.journal_file.stat().st_size:
+            os.truncate(self.journal_file, valid_bytes)
+        if replay_rows:
+            self._write_log_rows(replay_rows)
+        self._run_id = header["run_id"]
+        self._checkpoints = checkpoints
+        self.logger.info(f"Resuming interrupted compilation: recovered {len(bubbles)} bubbles from journal")
+        return bubbles
     
     def compile_evidence(self) -> bool:
-        """Main method to compile all evidence files."""
+        """
+        Main method to compile all evidence files.
+        
+        Work is checkpointed to a write-ahead journal every
+        checkpoint_interval files (or checkpoint_seconds), so a run that is
+        killed part-way resumes from its last checkpoint on the next call.
+        """
         self.logger.info("Starting evidence compilation...")
+        started = time.monotonic()
+        run_time = datetime.now()
+        self._run_id = run_time.strftime("%Y%m%d%H%M%S%f")
+        self._checkpoints = 0
+        self._pending_rows = []
+        self._image_index = self._index_images()
         
         # Scan for evidence files
         evidence_files = self._scan_evidence_files()
@@ -230,34 +823,150 @@ class MindseyeEvidenceCompiler:
             self.logger.warning("No evidence files found")
             return False
         
+        # Older logs gain the hash_algorithm/digests columns before new rows are added
+        try:
+            if upgrade_log_schema(self.log_file):
+                self.logger.info(f"Upgraded {self.log_file} to record hash algorithms")
+        except OSError as e:
+            self.logger.error(f"Could not upgrade log file {self.log_file}: {e}")
+            return False
+        
         # Process files
-        bubbles = []
-        new_files_processed = 0
+        sidecar = load_stats_sidecar(self.output_dir, self.output_suffix)
+        if not sidecar and (self.bubbles_file.exists() or self.log_file.exists()):
+            sidecar = rebuild_stats_sidecar(self.output_dir, self.evidence_root, self.output_suffix)
+        bubbles = self._recover_journal(sidecar)
+        new_files_processed = sum(1 for bubble in bubbles if "parent" not in bubble)
+        progress = ProgressReporter(self.logger, len(evidence_files),
+                                    self.config["logging"]["progress_interval"])
+        batch_bubbles = []
+        batch_sizes = []
+        last_checkpoint = time.monotonic()
         
-        for file_path in evidence_files:
-            relative_path = str(file_path.relative_to(self.evidence_root))
-            
-            # Skip if already processed
-            if relative_path in self.processed_files:
-                self.logger.info(f"Skipping already processed file: {relative_path}")
-                continue
+        if self.use_cache:
+            try:
+                self.cache = ResultCache(self.cache_file, self.cache_max_bytes)
+            except Exception as e:
+                self.logger.warning(f"Result cache unavailable, processing without it: {e}")
+        
+        # Files are started a few ahead of the one being finished so that
+        # expensive extractions overlap in the worker pool
+        in_flight = deque()
+        lookahead = 2 * (self.extract_workers or os.cpu_count() or 1)
+        
+        def checkpoint_due():
+            return (len(batch_bubbles) >= self.checkpoint_interval
+                    or time.monotonic() - last_checkpoint >= self.checkpoint_seconds)
+        
+        def emit_child(bubble):
+            # Segment bubbles join the batch as they are made, so a huge file
+            # is journaled in checkpoint-sized pieces rather than held whole
+            nonlocal last_checkpoint
+            bubbles.append(bubble)
+            batch_bubbles.append(bubble)
+            if checkpoint_due():
+                self._checkpoint(batch_bubbles, batch_sizes)
+                last_checkpoint = time.monotonic()
+        
+        def finish_next():
+            nonlocal new_files_processed, last_checkpoint
+            relative_path, task = in_flight.popleft()
+            file_path = task["path"]
+            emitted = len(bubbles)
+            file_bubbles = self._finish_file(task, emit_child)
             
-            self.logger.info(f"Processing file: {relative_path}")
-            bubble = self._process_file(file_path)
+            if not file_bubbles and len(bubbles) > emitted:
+                # A segmented file failed part-way; drop the children it made.
+                # Any already journaled are dropped on recovery, as the file has no row.
+                del bubbles[emitted:]
+                batch_bubbles[:] = [bubble for bubble in batch_bubbles
+                                    if bubble.get("parent") != relative_path]
             
-            if bubble:
-                bubbles.append(bubble)
+            if file_bubbles:
+                bubbles.extend(file_bubbles)
+                batch_bubbles.extend(file_bubbles)
                 new_files_processed += 1
                 self.processed_files.add(relative_path)
+                size = file_path.stat().st_size
+                batch_sizes.append([file_path.suffix, size])
+                _add_to_stats(sidecar, file_path.suffix, size)
+            progress.record("processed" if file_bubbles else "failed")
+            
+            if checkpoint_due():
+                self._checkpoint(batch_bubbles, batch_sizes)
+                self._save_stats(sidecar, run_time, started)
+                last_checkpoint = time.monotonic()
+        
+        try:
+            for file_path in evidence_files:
+                relative_path = str(file_path.relative_to(self.evidence_root))
+                
+                # Skip if already processed
+                # Per-file lines are DEBUG; progress summaries cover them at INFO
+                if relative_path in self.processed_files:
+                    self.logger.debug("Skipping already processed file: %s", relative_path)
+                    progress.record("skipped")
+                    continue
+                
+                self.logger.debug("Processing file: %s", relative_path)
+                in_flight.append((relative_path, self._start_file(file_path)))
+                if len(in_flight) >= lookahead:
+                    finish_next()
+            
+            while in_flight:
+                finish_next()
+            
+            self._checkpoint(batch_bubbles, batch_sizes)
+            progress.finish()
+        finally:
+            if self._extractor_pool:
+                self._extractor_pool.close()
+                self._extractor_pool = None
+            if self.cache:
+                self.logger.info(f"Result cache: {self.cache.hits} hits, {self.cache.misses} misses")
+                self.cache.close()
+                self.cache = None
         
         if not bubbles:
             self.logger.info("No new files to process")
+            if self.shard and not self.bubbles_file.exists():
+                # An empty shard still reports in so the merge sees it as complete
+                _write_json_atomic(self.bubbles_file, [])
+            self._publish_merkle_root(sidecar)
+            self._save_stats(sidecar, run_time, started)
+            self._finish_journal()
             return True
         
+        # Shard outputs accumulate until merged, so earlier runs' bubbles are kept.
+        # A run killed after saving them but before removing its journal
+        # recovers the same bubbles again; the recovered copies replace the saved ones.
+        if self.shard and self.bubbles_file.exists():
+            try:
+                with open(self.bubbles_file, 'r', encoding='utf-8') as f:
+                    existing = json.load(f)
+                new_keys = {_bubble_key(bubble) for bubble in bubbles}
+                bubbles = [bubble for bubble in existing if _bubble_key(bubble) not in new_keys] + bubbles
+            except Exception as e:
+                self.logger.error(f"Could not load existing shard bubbles: {e}")
+                return False
+        
         # Save bubbles to JSON
         try:
-            with open(self.bubbles_file, 'w', encoding='utf-8') as f:
-                json.dump(bubbles, f, indent=2, ensure_ascii=False)
+            _write_json_atomic(self.bubbles_file, bubbles)
+            
+            sidecar["total_bubbles"] = len(bubbles)
+            sidecar["last_compilation"] = run_time.strftime("%Y-%m-%d %H:%M:%S")
+            if not self.shard:
+                # Shard bubbles keep their tags and dates; merge indexes them
+                update_tag_index(self.output_dir / TAG_INDEX_FILENAME,
+                                 {bubble["path"]: bubble.get("tags", []) for bubble in bubbles
+                                  if "path" in bubble})
+                update_timeline(self.output_dir / TIMELINE_FILENAME,
+                                {bubble["path"]: bubble.get("incidentDate") for bubble in bubbles
+                                 if "path" in bubble})
+            self._publish_merkle_root(sidecar)
+            self._save_stats(sidecar, run_time, started)
+            self._finish_journal()
             
             self.logger.info(f"Successfully compiled {len(bubbles)} bubbles to {self.bubbles_file}")
             self.logger.info(f"Processed {new_files_processed} new files")
@@ -267,24 +976,48 @@ class MindseyeEvidenceCompiler:
             self.logger.error(f"Error saving bubbles file: {e}")
             return False
     
+    def _publish_merkle_root(self, sidecar: Dict[str, Any]):
+        """Publish the Merkle root of the ledger (shards are published by merge)."""
+        if self.shard:
+            return
+        try:
+            record = publish_root(self.output_dir)
+            sidecar["merkle_root"] = record["root"]
+            self.logger.info(f"Merkle root {record['root']} over {record['leaf_count']} files")
+        except OSError as e:
+            self.logger.warning(f"Could not publish Merkle root: {e}")
+    
+    def _finish_journal(self):
+        """Discard the journal once its bubbles are safely in the bubbles file."""
+        if self.journal_file.exists():
+            self.journal_file.unlink()
+    
+    def _save_stats(self, sidecar: Dict[str, Any], run_time: datetime, started: float):
+        """
+        Record run timing, atomically write the stats sidecar and refresh the log index.
+        
+        The sidecar notes how many of the journal's checkpoints it includes:
+        a crash after a checkpoint reaches the CSV log but before this write
+        leaves the rest to be counted when the journal is recovered.
+        """
+        sidecar["total_processed_files"] = len(self.processed_files)
+        sidecar["journal"] = {"run_id": self._run_id, "checkpoints": self._checkpoints}
+        # The web server serves bubble images from the root they were compiled from
+        sidecar["evidence_root"] = str(self.evidence_root.resolve())
+        sidecar["last_run"] = run_time.strftime("%Y-%m-%d %H:%M:%S")
+        sidecar["last_run_duration"] = round(time.monotonic() - started, 3)
+        try:
+            _write_json_atomic(self.stats_file, sidecar)
+        except OSError as e:
+            self.logger.warning(f"Could not write stats file: {e}")
+        try:
+            AuditLogIndex(self.log_file).refresh()
+        except OSError as e:
+            self.logger.warning(f"Could not update log index: {e}")
+    
     def get_compilation_stats(self) -> Dict[str, Any]:
         """Get statistics about the compilation process."""
-        stats = {
-            "total_processed_files": len(self.processed_files),
-            "bubbles_file_exists": self.bubbles_file.exists(),
-            "log_file_exists": self.log_file.exists(),
-            "evidence_root_exists": self.evidence_root.exists()
-        }
-        
-        if self.bubbles_file.exists():
-            try:
-                with open(self.bubbles_file, 'r', encoding='utf-8') as f:
-                    bubbles = json.load(f)
-                stats["total_bubbles"] = len(bubbles)
-            except:
-                stats["total_bubbles"] = 0
-        
-        return stats
+        return read_compilation_stats(self.output_dir, self.evidence_root)
 
 
 def main():
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Mindseye Text Extractors
+Registry of per-format text extractors and a worker pool for expensive ones.
+
+Author: AI Assistant
+Purpose: Turn HTML, CSV, email and PDF evidence into text for the bubble pipeline
+"""
+
+import csv
+import os
+from html import unescape
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+DEFAULT_TIMEOUT = 60.0
+DEFAULT_MEMORY_LIMIT = 1024 * 1024 * 1024
+
+EXTRACTORS: Dict[str, Callable[[Path], str]] = {}
+EXPENSIVE_EXTRACTORS = set()
+# Optional package each extractor needs, by extension
+EXTRACTOR_REQUIREMENTS: Dict[str, str] = {}
+
+# Line-by-line extractors for files too large to read whole (see segmentation.py)
+STREAMING_EXTRACTORS: Dict[str, Callable[[Iterable[str]], Iterator[str]]] = {}
+
+
+class ExtractionError(Exception):
+    """Raised when a file cannot be turned into text."""
+
+
+def register_extractor(*extensions: str, expensive: bool = False, requires: Optional[str] = None):
+    """
+    Register a function as the text extractor for one or more extensions.
+
+    Expensive extractors are run in the worker pool with a timeout and
+    memory cap instead of in the compiler process. An extractor that
+    requires an optional package is only used when that package is
+    installed.
+    """
+    def decorator(func: Callable[[Path], str]) -> Callable[[Path], str]:
+        for extension in extensions:
+            extension = extension.lower()
+            EXTRACTORS[extension] = func
+            if expensive:
+                EXPENSIVE_EXTRACTORS.add(extension)
+            else:
+                EXPENSIVE_EXTRACTORS.discard(extension)
+            if requires:
+                EXTRACTOR_REQUIREMENTS[extension] = requires
+            else:
+                EXTRACTOR_REQUIREMENTS.pop(extension, None)
+        return func
+    return decorator
+
+
+def register_streaming_extractor(*extensions: str):
+    """
+    Register a line-by-line extractor for one or more extensions.
+
+    The function receives the decoded lines of a file (with line endings)
+    and yields text lines, holding only what it needs for the current
+    line. Large files of these types are ingested in segments.
+    """
+    def decorator(func: Callable[[Iterable[str]], Iterator[str]]) -> Callable[[Iterable[str]], Iterator[str]]:
+        for extension in extensions:
+            STREAMING_EXTRACTORS[extension.lower()] = func
+        return func
+    return decorator
+
+
+def supports_streaming(extension: str) -> bool:
+    """Whether files with this extension can be ingested in segments."""
+    return extension.lower() in STREAMING_EXTRACTORS
+
+
+def extractor_id(extension: str) -> str:
+    """Name of the extractor for an extension; extensions sharing an extractor share the name."""
+    extractor = EXTRACTORS.get(extension.lower())
+    return extractor.__name__ if extractor else ""
+
+
+def is_expensive(extension: str) -> bool:
+    """Whether files with this extension are extracted in the worker pool."""
+    return extension.lower() in EXPENSIVE_EXTRACTORS
+
+
+def extract_text(file_path) -> str:
+    """Extract text from a file using the extractor registered for its extension."""
+    file_path = Path(file_path)
+    extractor = EXTRACTORS.get(file_path.suffix.lower())
+    if extractor is None:
+        raise ExtractionError(f"No extractor registered for {file_path.suffix}")
+    return extractor(file_path)
+
+
+def _decode(data: bytes) -> str:
+    """Decode bytes as UTF-8 (with or without BOM), falling back to Windows-1252."""
+    try:
+        return data.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        return data.decode('cp1252', errors='replace')
+
+
+@register_extractor('.txt', '.md')
+def extract_plain_text(file_path: Path) -> str:
+    """Plain text and Markdown are used as-is."""
+    with open(file_path, 'rb') as f:
+        return _decode(f.read())
+
+
+@register_streaming_extractor('.txt', '.md')
+def stream_plain_text(lines: Iterable[str]) -> Iterator[str]:
+    """Plain text and Markdown lines are used as-is."""
+    return iter(lines)
+
+
+class _HTMLTextParser(HTMLParser):
+    """Collect visible text from an HTML document."""
+
+    _SKIP = {'script', 'style', 'head', 'noscript'}
+    _BLOCK = {'p', 'div', 'br', 'li', 'tr', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'section', 'article'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self._SKIP:
+            self._skip_depth += 1
+        elif tag in self._BLOCK:
+            self.parts.append('\n')
+        elif tag == 'a':
+            # Keep link targets so URL extraction still sees them
+            href = dict(attrs).get('href')
+            if href and href.startswith(('http://', 'https://')):
+                self.parts.append(f' {href} ')
+
+    def handle_endtag(self, tag):
+        if tag in self._SKIP and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+
+
+def _html_to_text(markup: str) -> str:
+    parser = _HTMLTextParser()
+    parser.feed(markup)
+    parser.close()
+    lines = (' '.join(line.split()) for line in unescape(''.join(parser.parts)).splitlines())
+    return '\n'.join(line for line in lines if line)
+
+
+@register_extractor('.html', '.htm')
+def extract_html(file_path: Path) -> str:
+    """HTML exports: visible text with scripts and styles removed."""
+    with open(file_path, 'rb') as f:
+        return _html_to_text(_decode(f.read()))
+
+
+@register_extractor('.csv')
+def extract_csv(file_path: Path) -> str:
+    """CSV incident extracts: one line per row, cells separated by ' | '."""
+    with open(file_path, 'rb') as f:
+        text = _decode(f.read())
+    return '\n'.join(' | '.join(cell.strip() for cell in row) for row in csv.reader(text.splitlines()))
+
+
+@register_streaming_extractor('.csv')
+def stream_csv(lines: Iterable[str]) -> Iterator[str]:
+    """CSV rows as extract_csv formats them, one line per row."""
+    for row in csv.reader(lines):
+        yield ' | '.join(cell.strip() for cell in row) + '\n'
+
+
+@register_extractor('.eml', expensive=True)
+def extract_email(file_path: Path) -> str:
+    """EML emails: key headers followed by the text body (HTML bodies are stripped)."""
+    import email
+    import email.policy
+
+    with open(file_path, 'rb') as f:
+        message = email.message_from_binary_file(f, policy=email.policy.default)
+
+    lines = []
+    for header in ('Subject', 'From', 'To', 'Cc', 'Date'):
+        if message[header]:
+            lines.append(f"{header}: {message[header]}")
+    lines.append('')
+
+    body = message.get_body(preferencelist=('plain', 'html'))
+    if body is not None:
+        content = body.get_content()
+        lines.append(_html_to_text(content) if body.get_content_type() == 'text/html' else content)
+    return '\n'.join(lines)
+
+
+@register_extractor('.pdf', expensive=True, requires='pypdf')
+def extract_pdf(file_path: Path) -> str:
+    """PDFs: text of every page (requires the optional pypdf package)."""
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        raise ExtractionError("PDF extraction requires the optional 'pypdf' package")
+    reader = PdfReader(str(file_path))
+    return '\n\n'.join(page.extract_text() or '' for page in reader.pages)
+
+
+def _limit_worker_memory(max_bytes: Optional[int]):
+    """Pool initializer: cap the worker's address space where the OS allows it."""
+    if not max_bytes:
+        return
+    try:
+        import resource
+        resource.setrlimit(resource.RLIMIT_AS, (max_bytes, max_bytes))
+    except (ImportError, ValueError, OSError):
+        pass  # Not supported on this platform; run uncapped
+
+
+class ExtractorPool:
+    """
+    Process pool for expensive extractors.
+
+    Each file gets a timeout and each worker a memory cap, so one
+    pathological file fails on its own instead of stalling or exhausting
+    the compiler. A worker that times out is killed by restarting the pool.
+    """
+
+    def __init__(self, workers: Optional[int] = None, timeout: float = DEFAULT_TIMEOUT,
+                 memory_limit: Optional[int] = DEFAULT_MEMORY_LIMIT):
+        """
+        Initialize the pool (worker processes start on first use).
+
+        Args:
+            workers: Number of worker processes (default: CPU count)
+            timeout: Seconds to wait for a single file's extraction
+            memory_limit: Address-space cap per worker in bytes (None for no cap)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self._pool = None
+        self._generation = 0
+
+    def _ensure_pool(self):
+        # Imported on first use; most runs and the web server never need a pool
+        import multiprocessing
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(self.workers, _limit_worker_memory, (self.memory_limit,))
+        return self._pool
+
+    def submit(self, file_path: Path) -> 'PendingExtraction':
+        """Start extracting a file in the background."""
+        return PendingExtraction(self, Path(file_path))
+
+    def restart(self):
+        """Kill all workers; pending extractions resubmit themselves."""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+            # Tasks submitted before this point died with the pool
+            self._generation += 1
+
+    def close(self):
+        """Shut the pool down, killing any extraction still running."""
+        self.restart()
+
+
+class PendingExtraction:
+    """Handle for one file being extracted in an ExtractorPool."""
+
+    def __init__(self, pool: ExtractorPool, file_path: Path):
+        self.pool = pool
+        self.file_path = file_path
+        self._submit()
+
+    def _submit(self):
+        self._result = self.pool._ensure_pool().apply_async(extract_text, (self.file_path,))
+        self._generation = self.pool._generation
+
+    def result(self) -> str:
+        """
+        Wait for the extracted text.
+
+        Raises:
+            ExtractionError: If extraction failed, ran out of memory or timed out
+        """
+        import multiprocessing
+        if self._generation != self.pool._generation and not self._result.ready():
+            # The pool was restarted after a timeout; this task died with it
+            self._submit()
+        try:
+            return self._result.get(self.pool.timeout)
+        except multiprocessing.TimeoutError:
+            self.pool.restart()
+            raise ExtractionError(f"Extraction timed out after {self.pool.timeout:.0f}s")
+        except MemoryError:
+            raise ExtractionError("Extraction exceeded the worker memory limit")
+        except ExtractionError:
+            raise
+        except Exception as e:
+            raise ExtractionError(f"Extraction failed: {e}")
+
+
+def _requirement_installed(extension: str) -> bool:
+    """Whether the optional package an extractor needs (if any) can be imported."""
+    from importlib.util import find_spec
+    requirement = EXTRACTOR_REQUIREMENTS.get(extension.lower())
+    return requirement is None or find_spec(requirement) is not None
+
+
+def supported_extensions(file_types: Iterable[str]) -> List[str]:
+    """Filter configured file types down to those with a usable extractor."""
+    return [extension for extension in file_types
+            if extension.lower() in EXTRACTORS and _requirement_installed(extension)]
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Mindseye Audit Log Index
+Byte-offset index and compaction for the append-only compiler_log.csv.
+
+Author: AI Assistant
+Purpose: Tail, time-range and ranged access to the audit log without reading it whole
+"""
+
+import csv
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Tuple
+import struct
+
+INDEX_SUFFIX = ".idx"
+
+# Ledger columns. Logs written before hash_algorithm/digests existed are
+# SHA-256 only; an empty hash_algorithm means sha256.
+LOG_FIELDS = ['filename', 'hash', 'timestamp', 'status', 'hash_algorithm', 'digests']
+LEGACY_HASH_ALGORITHM = 'sha256'
+
+# Index layout: header (log bytes covered, rows indexed) followed by one
+# fixed-width record per log row (byte offset, "YYYY-MM-DD HH:MM:SS").
+_HEADER = struct.Struct("<QQ")
+_RECORD = struct.Struct("<Q19s")
+
+
+def _parse_row(line: bytes) -> list:
+    """Parse a single CSV line from the log."""
+    try:
+        return next(csv.reader([line.decode('utf-8')]), [])
+    except (UnicodeDecodeError, csv.Error):
+        return []
+
+
+def normalize_timestamp(value: str) -> str:
+    """Normalise an ISO-ish timestamp to the log's 'YYYY-MM-DD HH:MM:SS' form."""
+    return value.strip().replace('T', ' ')[:19]
+
+
+class AuditLogIndex:
+    """Byte-offset index over compiler_log.csv, kept in a sidecar .idx file."""
+
+    def __init__(self, log_file):
+        """
+        Initialize the index.
+
+        Args:
+            log_file: Path to the compiler_log.csv to index
+        """
+        self.log_file = Path(log_file)
+        self.index_file = self.log_file.with_name(self.log_file.name + INDEX_SUFFIX)
+
+    def _read_header(self) -> Optional[Tuple[int, int]]:
+        """Return (covered bytes, row count) or None if the index is missing or damaged."""
+        try:
+            with open(self.index_file, 'rb') as f:
+                data = f.read(_HEADER.size)
+            if len(data) != _HEADER.size:
+                return None
+            covered, count = _HEADER.unpack(data)
+            if self.index_file.stat().st_size < _HEADER.size + count * _RECORD.size:
+                return None
+            return covered, count
+        except OSError:
+            return None
+
+    def _timestamp_column(self, log) -> int:
+        """Locate the timestamp column from the log's CSV header."""
+        log.seek(0)
+        header = _parse_row(log.readline())
+        return header.index('timestamp') if 'timestamp' in header else 2
+
+    def refresh(self) -> int:
+        """
+        Bring the index up to date with the log.
+
+        Only bytes appended since the last refresh are scanned; the index is
+        rebuilt from scratch if the log was truncated or replaced.
+
+        Returns:
+            Number of rows indexed
+        """
+        if not self.log_file.exists():
+            if self.index_file.exists():
+                self.index_file.unlink()
+            return 0
+
+        log_size = self.log_file.stat().st_size
+        header = self._read_header()
+        if header and header[0] == log_size:
+            return header[1]
+        if not header or header[0] > log_size:
+            header = None
+
+        with open(self.log_file, 'rb') as log:
+            ts_column = self._timestamp_column(log)
+            data_start = log.tell()
+            start, count = header if header else (data_start, 0)
+            start = max(start, data_start)
+
+            mode = 'r+b' if header else 'w+b'
+            with open(self.index_file, mode) as idx:
+                idx.truncate(_HEADER.size + count * _RECORD.size)
+                idx.seek(_HEADER.size + count * _RECORD.size)
+                log.seek(start)
+                offset = start
+                covered = start
+                for line in log:
+                    if not line.endswith(b'\n'):
+                        break  # partially written row; pick it up next time
+                    row = _parse_row(line)
+                    timestamp = row[ts_column] if len(row) > ts_column else ''
+                    idx.write(_RECORD.pack(offset, normalize_timestamp(timestamp).encode('utf-8')))
+                    count += 1
+                    offset += len(line)
+                    covered = offset
+                idx.seek(0)
+                idx.write(_HEADER.pack(covered, count))
+        return count
+
+    def __len__(self) -> int:
+        header = self._read_header()
+        return header[1] if header else 0
+
+    def _record(self, idx, position: int) -> Tuple[int, str]:
+        """Read the (offset, timestamp) record for a row."""
+        idx.seek(_HEADER.size + position * _RECORD.size)
+        offset, timestamp = _RECORD.unpack(idx.read(_RECORD.size))
+        return offset, timestamp.rstrip(b'\0').decode('utf-8')
+
+    def header_bytes(self) -> bytes:
+        """Return the CSV header line of the log."""
+        with open(self.log_file, 'rb') as f:
+            return f.readline()
+
+    def tail_offset(self, rows: int) -> int:
+        """Byte offset of the first of the last `rows` rows."""
+        header = self._read_header()
+        if not header:
+            return len(self.header_bytes())
+        covered, count = header
+        if rows <= 0:
+            return covered
+        with open(self.index_file, 'rb') as idx:
+            return self._record(idx, max(count - rows, 0))[0] if count else covered
+
+    def since_offset(self, timestamp: str) -> int:
+        """Byte offset of the first row logged at or after `timestamp` (binary search)."""
+        header = self._read_header()
+        if not header:
+            return len(self.header_bytes())
+        covered, count = header
+        target = normalize_timestamp(timestamp)
+        low, high = 0, count
+        with open(self.index_file, 'rb') as idx:
+            while low < high:
+                mid = (low + high) // 2
+                if self._record(idx, mid)[1] < target:
+                    low = mid + 1
+                else:
+                    high = mid
+            return self._record(idx, low)[0] if low < count else covered
+
+
+def row_hash_algorithm(row: dict) -> str:
+    """The algorithm a ledger row's hash was computed with."""
+    return row.get('hash_algorithm') or LEGACY_HASH_ALGORITHM
+
+
+def format_digests(digests: dict) -> str:
+    """Serialise secondary digests for the ledger's digests column."""
+    return ';'.join(f"{algorithm}={digest}" for algorithm, digest in sorted(digests.items()))
+
+
+def parse_digests(value: str) -> dict:
+    """Parse the ledger's digests column back into {algorithm: digest}."""
+    digests = {}
+    for item in (value or '').split(';'):
+        if '=' in item:
+            algorithm, digest = item.split('=', 1)
+            digests[algorithm] = digest
+    return digests
+
+
+def upgrade_log_schema(log_file) -> bool:
+    """
+    Add any missing LOG_FIELDS columns to an existing log.
+
+    Existing rows keep their values; new columns are left empty (so legacy
+    hashes read as SHA-256). The log is replaced atomically and its index
+    dropped so it is rebuilt.
+
+    Returns:
+        True if the log was rewritten
+    """
+    log_file = Path(log_file)
+    if not log_file.exists():
+        return False
+    with open(log_file, 'r', newline='', encoding='utf-8') as f:
+        header = next(csv.reader(f), None)
+    if header is None or all(field in header for field in LOG_FIELDS):
+        return False
+
+    fieldnames = header + [field for field in LOG_FIELDS if field not in header]
+    tmp_path = log_file.with_name(log_file.name + ".tmp")
+    with open(log_file, 'r', newline='', encoding='utf-8') as src, \
+         open(tmp_path, 'w', newline='', encoding='utf-8') as dst:
+        writer = csv.DictWriter(dst, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(csv.DictReader(src))
+        dst.flush()
+        os.fsync(dst.fileno())
+    os.replace(tmp_path, log_file)
+
+    index_file = AuditLogIndex(log_file).index_file
+    if index_file.exists():
+        index_file.unlink()
+    return True
+
+
+def compact_log(log_file, archive_dir=None) -> Tuple[int, int, Optional[Path]]:
+    """
+    Compact the audit log, keeping only the latest entry per file.
+
+    Superseded rows are appended to a timestamped archive CSV so the full
+    history is preserved; the live log is replaced atomically.
+
+    Args:
+        log_file: Path to compiler_log.csv
+        archive_dir: Directory for archived rows (default: log_archive/ next to the log)
+
+    Returns:
+        Tuple of (rows kept, rows archived, archive path or None)
+    """
+    log_file = Path(log_file)
+    if not log_file.exists():
+        return 0, 0, None
+
+    # First pass: find the last row for each filename
+    latest = {}
+    with open(log_file, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return 0, 0, None
+        name_column = header.index('filename') if 'filename' in header else 0
+        for position, row in enumerate(reader):
+            if len(row) > name_column:
+                latest[row[name_column]] = position
+
+    # Second pass: split rows into kept and archived
+    archive_dir = Path(archive_dir) if archive_dir else log_file.parent / "log_archive"
+    archive_path = archive_dir / f"{log_file.stem}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+    tmp_path = log_file.with_name(log_file.name + ".tmp")
+    kept = archived = 0
+    archive = None
+    try:
+        with open(log_file, 'r', newline='', encoding='utf-8') as src, \
+             open(tmp_path, 'w', newline='', encoding='utf-8') as dst:
+            reader = csv.reader(src)
+            next(reader)
+            writer = csv.writer(dst)
+            writer.writerow(header)
+            for position, row in enumerate(reader):
+                if len(row) > name_column and latest.get(row[name_column]) == position:
+                    writer.writerow(row)
+                    kept += 1
+                    continue
+                if archive is None:
+                    archive_dir.mkdir(parents=True, exist_ok=True)
+                    archive = open(archive_path, 'w', newline='', encoding='utf-8')
+                    archive_writer = csv.writer(archive)
+                    archive_writer.writerow(header)
+                archive_writer.writerow(row)
+                archived += 1
+            dst.flush()
+            os.fsync(dst.fileno())
+    finally:
+        if archive is not None:
+            archive.close()
+
+    if archived:
+        os.replace(tmp_path, log_file)
+        AuditLogIndex(log_file).refresh()
+    else:
+        tmp_path.unlink()
+    return kept, archived, archive_path if archived else None
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Mindseye Merkle Verification
+Merkle tree over the audit ledger for proving evidence has not changed.
+
+Author: AI Assistant
+Purpose: Publish a corpus root per compile, verify files against it and issue inclusion proofs
+"""
+
+import csv
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+TREE_FILENAME = "merkle_tree.json"
+ROOTS_FILENAME = "merkle_roots.jsonl"
+
+# Interior nodes always use SHA-256, whatever algorithm hashed the files.
+# Leaves and nodes are domain-separated so a node can never pose as a leaf.
+TREE_HASH = "sha256"
+_LEAF_PREFIX = b"\x00"
+_NODE_PREFIX = b"\x01"
+
+MISSING = "missing"
+
+
+def leaf_hash(path: str, algorithm: str, file_hash: str) -> bytes:
+    """Hash of one ledger entry (relative path, hash algorithm, file hash)."""
+    data = f"{path}\x00{algorithm}:{file_hash}".encode('utf-8')
+    return hashlib.sha256(_LEAF_PREFIX + data).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    """Hash of an interior node."""
+    return hashlib.sha256(_NODE_PREFIX + left + right).digest()
+
+
+class MerkleTree:
+    """
+    Binary Merkle tree over (path, algorithm, hash) entries sorted by path.
+
+    A node without a sibling is carried up unchanged rather than paired
+    with itself, so every leaf set has exactly one root.
+    """
+
+    def __init__(self, entries: List[Tuple[str, str, str]]):
+        """
+        Build the tree.
+
+        Args:
+            entries: (relative path, hash algorithm, file hash) per file
+        """
+        self.entries = sorted(entries)
+        self.positions = {path: index for index, (path, _, _) in enumerate(self.entries)}
+        self.levels = [[leaf_hash(*entry) for entry in self.entries]]
+        while len(self.levels[-1]) > 1:
+            below = self.levels[-1]
+            level = [node_hash(below[i], below[i + 1]) for i in range(0, len(below) - 1, 2)]
+            if len(below) % 2:
+                level.append(below[-1])
+            self.levels.append(level)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @property
+    def root(self) -> str:
+        """Hex root ('' for an empty ledger)."""
+        return self.levels[-1][0].hex() if self.entries else ""
+
+    def proof(self, path: str) -> Dict[str, Any]:
+        """
+        Inclusion proof for one file: the sibling hashes from its leaf to the root.
+
+        Raises:
+            KeyError: If the path is not in the tree
+        """
+        index = self.positions[path]
+        _, algorithm, file_hash = self.entries[index]
+        siblings = []
+        position = index
+        for level in self.levels[:-1]:
+            sibling = position ^ 1
+            if sibling < len(level):
+                siblings.append({"side": "left" if sibling < position else "right",
+                                 "hash": level[sibling].hex()})
+            position //= 2
+        return {
+            "path": path,
+            "hash_algorithm": algorithm,
+            "hash": file_hash,
+            "leaf_index": index,
+            "leaf_count": len(self.entries),
+            "tree_hash": TREE_HASH,
+            "root": self.root,
+            "siblings": siblings,
+        }
+
+    def diff(self, other: 'MerkleTree') -> Tuple[List[int], Optional[Dict[str, Any]]]:
+        """
+        Compare two trees over the same paths, descending only into differing subtrees.
+
+        Returns:
+            (indexes of differing leaves, smallest subtree containing them
+            as {"level", "index", "first_path", "last_path", "leaves"} or None)
+        """
+        if [entry[0] for entry in self.entries] != [entry[0] for entry in other.entries]:
+            raise ValueError("Trees cover different paths")
+        if self.root == other.root:
+            return [], None
+
+        changed = []
+        frontier = [(len(self.levels) - 1, 0)]
+        while frontier:
+            level, index = frontier.pop()
+            if self.levels[level][index] == other.levels[level][index]:
+                continue
+            if level == 0:
+                changed.append(index)
+                continue
+            for child in (2 * index, 2 * index + 1):
+                if child < len(self.levels[level - 1]):
+                    frontier.append((level - 1, child))
+        changed.sort()
+
+        # Climb from the first changed leaf until its subtree spans the last one
+        level, index = 0, changed[0]
+        while (changed[-1] >> level) != index:
+            level += 1
+            index >>= 1
+        first = index << level
+        last = min(((index + 1) << level), len(self.entries)) - 1
+        subtree = {
+            "level": level,
+            "index": index,
+            "first_path": self.entries[first][0],
+            "last_path": self.entries[last][0],
+            "leaves": last - first + 1,
+        }
+        return changed, subtree
+
+
+def verify_proof(proof: Dict[str, Any], root: Optional[str] = None) -> bool:
+    """Check an inclusion proof against its root (or an independently held root)."""
+    current = leaf_hash(proof["path"], proof["hash_algorithm"], proof["hash"])
+    for sibling in proof["siblings"]:
+        other = bytes.fromhex(sibling["hash"])
+        current = node_hash(other, current) if sibling["side"] == "left" else node_hash(current, other)
+    return current.hex() == (root or proof["root"])
+
+
+def ledger_entries(log_file) -> List[Tuple[str, str, str]]:
+    """Latest (path, algorithm, hash) per file from the audit log."""
+    from log_index import row_hash_algorithm
+
+    latest = {}
+    log_file = Path(log_file)
+    if log_file.exists():
+        with open(log_file, 'r', newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                if row.get('status') == 'processed' and row.get('hash'):
+                    latest[row['filename']] = (row_hash_algorithm(row), row['hash'])
+    return [(path, algorithm, file_hash) for path, (algorithm, file_hash) in latest.items()]
+
+
+def load_snapshot(output_dir=".") -> Optional[Dict[str, Any]]:
+    """Load the tree snapshot written by the last publish, or None."""
+    tree_file = Path(output_dir) / TREE_FILENAME
+    if not tree_file.exists():
+        return None
+    with open(tree_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def publish_root(output_dir=".") -> Dict[str, Any]:
+    """
+    Build the tree from the audit log and publish its root.
+
+    The snapshot (merkle_tree.json) holds the leaves so later verification
+    can localise changes; merkle_roots.jsonl is an append-only history of
+    roots, extended only when the root changes.
+
+    Returns:
+        The published record {"root", "leaf_count", "tree_hash", "published"}
+    """
+    from evidence_compiler import _write_json_atomic
+
+    output_dir = Path(output_dir)
+    tree = MerkleTree(ledger_entries(output_dir / "compiler_log.csv"))
+    previous = load_snapshot(output_dir)
+    if previous and previous.get("root") == tree.root:
+        return {key: previous[key] for key in ("root", "leaf_count", "tree_hash", "published")}
+
+    record = {
+        "root": tree.root,
+        "leaf_count": len(tree),
+        "tree_hash": TREE_HASH,
+        "published": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    _write_json_atomic(output_dir / TREE_FILENAME,
+                       dict(record, leaves=[list(entry) for entry in tree.entries]), indent=None)
+    with open(output_dir / ROOTS_FILENAME, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    return record
+
+
+def _rehash(evidence_root: Path, entry: Tuple[str, str, str]) -> Tuple[str, str, str]:
+    from evidence_compiler import hash_file
+
+    path, algorithm, _ = entry
+    try:
+        return path, algorithm, hash_file(evidence_root / path, [algorithm])[algorithm]
+    except OSError:
+        return path, algorithm, MISSING
+
+
+def verify_corpus(evidence_root, output_dir=".", prefix: str = "", expected_root: Optional[str] = None,
+                  workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Re-hash evidence and check it against the published Merkle tree.
+
+    Files are re-hashed in parallel threads (hashlib releases the GIL).
+    With a prefix only files under it are re-hashed; the rest of the tree
+    is taken from the snapshot, which is itself checked against the
+    published (or expected) root, so the result is still a statement
+    about the whole corpus root.
+
+    Args:
+        evidence_root: Evidence root the ledger paths are relative to
+        output_dir: Directory holding the snapshot and audit log
+        prefix: Only re-hash files whose relative path starts with this
+        expected_root: Root recorded elsewhere to check the snapshot against
+        workers: Hashing threads (default: CPU count)
+
+    Returns:
+        Verification report; "ok" is True only if nothing differs
+
+    Raises:
+        ValueError: If nothing has been published yet
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    output_dir = Path(output_dir)
+    evidence_root = Path(evidence_root)
+    snapshot = load_snapshot(output_dir)
+    if snapshot is None:
+        raise ValueError(f"No published Merkle tree in {output_dir}; run compile first")
+
+    published = MerkleTree([tuple(leaf) for leaf in snapshot["leaves"]])
+    snapshot_intact = published.root == snapshot["root"]
+    root_matches = expected_root is None or expected_root == snapshot["root"]
+    ledger_root = MerkleTree(ledger_entries(output_dir / "compiler_log.csv")).root
+
+    selected = [entry for entry in published.entries if entry[0].startswith(prefix)]
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+        rehashed = {entry[0]: entry for entry in pool.map(lambda e: _rehash(evidence_root, e), selected)}
+    current = MerkleTree([rehashed.get(entry[0], entry) for entry in published.entries])
+
+    changed, subtree = published.diff(current)
+    report = {
+        "root": snapshot["root"],
+        "published": snapshot.get("published"),
+        "current_root": current.root,
+        "leaf_count": len(published),
+        "checked": len(selected),
+        "prefix": prefix,
+        "snapshot_intact": snapshot_intact,
+        "root_matches_expected": root_matches,
+        "ledger_matches_snapshot": ledger_root == snapshot["root"],
+        "modified": [current.entries[i][0] for i in changed if current.entries[i][2] != MISSING],
+        "missing": [current.entries[i][0] for i in changed if current.entries[i][2] == MISSING],
+        "changed_subtree": subtree,
+    }
+    report["ok"] = (snapshot_intact and root_matches and report["ledger_matches_snapshot"]
+                    and not changed)
+    return report
+
+
+def inclusion_proof(output_dir, path: str) -> Dict[str, Any]:
+    """
+    Inclusion proof for one file against the published root.
+
+    Raises:
+        ValueError: If nothing has been published yet
+        KeyError: If the file is not in the published tree
+    """
+    snapshot = load_snapshot(output_dir)
+    if snapshot is None:
+        raise ValueError(f"No published Merkle tree in {output_dir}; run compile first")
+    tree = MerkleTree([tuple(leaf) for leaf in snapshot["leaves"]])
+    return tree.proof(path)
@@ -8,12 +8,28 @@ Purpose: Easy-to-use CLI for evidence compilation
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
-from evidence_compiler import MindseyeEvidenceCompiler
+from typing import List, Optional
+from mindseye_config import CONFIG_ENV_VAR, load_config
 
-def main():
-    """Main CLI entry point."""
+# Heavier modules (compiler, extractors, web server) are imported by the
+# command that needs them, so e.g. 'init' or 'serve' start quickly.
+
+def run(argv: Optional[List[str]] = None) -> int:
+    """
+    Run one CLI command in the current process.
+    
+    This is the shared entry point for the CLI, start_mindseye.py and
+    demo.py, so launchers do not pay for a new interpreter per step.
+    
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+    
+    Returns:
+        Exit status (0 on success)
+    """
     parser = argparse.ArgumentParser(
         description="Mindseye Evidence Compiler - Healthcare & Safeguarding Evidence Management",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -25,74 +41,199 @@ Examples:
   # Compile with custom paths
   python mindseye_cli.py compile --evidence-root /path/to/evidence --output-dir /path/to/output
 
+  # Compile one of four shards in parallel, then merge the shard outputs
+  python mindseye_cli.py compile --shard 0/4   # ... through --shard 3/4
+  python mindseye_cli.py merge --output-dir .
+
   # Show statistics
   python mindseye_cli.py stats
 
   # Start web server
   python mindseye_cli.py serve --port 8080
 
+  # Inspect or prune the result cache
+  python mindseye_cli.py cache --output-dir . --prune --max-size 32
+
+  # Compact the audit log (keep the latest entry per file, archive the rest)
+  python mindseye_cli.py compact-log --output-dir .
+
+  # Verify evidence against the published Merkle root, or print a file's inclusion proof
+  python mindseye_cli.py verify --evidence-root /evidence
+  python mindseye_cli.py verify --proof reports/quarterly_summary.md
+
+  # Write a static copy of the dashboard (no server needed to view it)
+  python mindseye_cli.py export-static --dest mindseye_static --chunked
+
   # Create sample evidence structure
   python mindseye_cli.py init --evidence-root /evidence
+
+  # Use an alternative configuration file
+  python mindseye_cli.py --config /etc/mindseye/config.json compile
         """
     )
+    parser.add_argument('--config', default=None, 
+                       help=f'Configuration file (default: ${CONFIG_ENV_VAR} or config.json)')
     
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
     # Compile command
     compile_parser = subparsers.add_parser('compile', help='Compile evidence files')
-    compile_parser.add_argument('--evidence-root', default='/evidence', 
-                               help='Root directory to scan for evidence files')
-    compile_parser.add_argument('--output-dir', default='.', 
-                               help='Output directory for compiled files')
+    compile_parser.add_argument('--evidence-root', default=None, 
+                               help='Root directory to scan for evidence files (default: from config.json)')
+    compile_parser.add_argument('--output-dir', default=None, 
+                               help='Output directory for compiled files (default: from config.json)')
     compile_parser.add_argument('--verbose', '-v', action='store_true', 
                                help='Enable verbose output')
+    compile_parser.add_argument('--no-cache', action='store_true', 
+                               help='Re-extract every file instead of reusing cached results')
+    compile_parser.add_argument('--shard', default=None, metavar='I/N', 
+                               help='Compile only shard I of N (0-based) into shard-suffixed outputs')
+    
+    # Merge command
+    merge_parser = subparsers.add_parser('merge', help='Merge shard outputs into bubbles.json and the log')
+    merge_parser.add_argument('--output-dir', default=None, 
+                             help='Output directory containing the shard outputs (default: from config.json)')
+    merge_parser.add_argument('--shards', type=int, default=None, 
+                             help='Shard count N to merge (needed only if several are present)')
+    merge_parser.add_argument('--allow-partial', action='store_true', 
+                             help='Merge even if some shards are missing')
     
     # Stats command
     stats_parser = subparsers.add_parser('stats', help='Show compilation statistics')
-    stats_parser.add_argument('--evidence-root', default='/evidence', 
-                             help='Evidence root directory')
-    stats_parser.add_argument('--output-dir', default='.', 
-                             help='Output directory')
+    stats_parser.add_argument('--evidence-root', default=None, 
+                             help='Evidence root directory (default: from config.json)')
+    stats_parser.add_argument('--output-dir', default=None, 
+                             help='Output directory (default: from config.json)')
     
     # Serve command
     serve_parser = subparsers.add_parser('serve', help='Start web server')
-    serve_parser.add_argument('--host', default='localhost', 
-                             help='Host to bind to')
-    serve_parser.add_argument('--port', type=int, default=8080, 
-                             help='Port to bind to')
+    serve_parser.add_argument('--host', default=None, 
+                             help='Host to bind to (default: from config.json)')
+    serve_parser.add_argument('--port', type=int, default=None, 
+                             help='Port to bind to (default: from config.json)')
+    serve_parser.add_argument('--open', action='store_true', 
+                             help='Open the dashboard in a browser once the server is listening')
+    
+    # Cache command
+    cache_parser = subparsers.add_parser('cache', help='Inspect or prune the result cache')
+    cache_parser.add_argument('--output-dir', default=None, 
+                             help='Output directory containing the cache (default: from config.json)')
+    cache_parser.add_argument('--prune', action='store_true', 
+                             help='Evict least recently used entries down to --max-size')
+    cache_parser.add_argument('--max-size', type=float, default=None, 
+                             help='Cache size bound in MB (default: 64)')
+    cache_parser.add_argument('--clear', action='store_true', 
+                             help='Remove every cached entry')
+    
+    # Compact-log command
+    compact_parser = subparsers.add_parser('compact-log', help='Compact the audit log, archiving superseded entries')
+    compact_parser.add_argument('--output-dir', default=None, 
+                               help='Output directory containing compiler_log.csv (default: from config.json)')
+    compact_parser.add_argument('--archive-dir', default=None, 
+                               help='Directory for archived rows (default: <output-dir>/log_archive)')
+    
+    # Verify command
+    verify_parser = subparsers.add_parser('verify', help='Verify evidence against the published Merkle root')
+    verify_parser.add_argument('--evidence-root', default=None, 
+                              help='Evidence root directory (default: from config.json)')
+    verify_parser.add_argument('--output-dir', default=None, 
+                              help='Output directory containing merkle_tree.json (default: from config.json)')
+    verify_parser.add_argument('--prefix', default='', 
+                              help='Only re-hash files whose relative path starts with this')
+    verify_parser.add_argument('--expected-root', default=None, 
+                              help='Root recorded elsewhere to check the published tree against')
+    verify_parser.add_argument('--workers', type=int, default=None, 
+                              help='Hashing threads (default: CPU count)')
+    verify_parser.add_argument('--proof', default=None, metavar='PATH', 
+                              help='Print the inclusion proof for one file instead of verifying')
+    
+    # Export-static command
+    export_parser = subparsers.add_parser('export-static', help='Write a self-contained static copy of the dashboard')
+    export_parser.add_argument('--evidence-root', default=None, 
+                              help='Evidence root directory (default: from config.json)')
+    export_parser.add_argument('--output-dir', default=None, 
+                              help='Output directory containing bubbles.json (default: from config.json)')
+    export_parser.add_argument('--dest', default='mindseye_static', 
+                              help='Directory to write the snapshot to (default: mindseye_static)')
+    export_parser.add_argument('--chunked', action='store_true', 
+                              help='Put the data in content-hashed chunk files instead of embedding it in index.html')
+    export_parser.add_argument('--chunk-size', type=int, default=256, metavar='KB', 
+                              help='Target chunk size in KB with --chunked (default: 256)')
+    export_parser.add_argument('--no-gzip', action='store_true', 
+                              help='Do not write pre-compressed .gz variants')
     
     # Init command
     init_parser = subparsers.add_parser('init', help='Initialize evidence directory structure')
-    init_parser.add_argument('--evidence-root', default='/evidence', 
-                            help='Evidence root directory to create')
+    init_parser.add_argument('--evidence-root', default=None, 
+                            help='Evidence root directory to create (default: from config.json)')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if not args.command:
         parser.print_help()
-        return
+        return 0
     
     try:
+        if args.config:
+            # Exported so the compiler and web server load the same file
+            os.environ[CONFIG_ENV_VAR] = args.config
+        apply_config_defaults(args, load_config())
+        
         if args.command == 'compile':
             compile_evidence(args)
+        elif args.command == 'merge':
+            merge_shard_outputs(args)
         elif args.command == 'stats':
             show_stats(args)
         elif args.command == 'serve':
             start_server(args)
+        elif args.command == 'cache':
+            manage_cache(args)
+        elif args.command == 'compact-log':
+            compact_audit_log(args)
+        elif args.command == 'verify':
+            verify_evidence(args)
+        elif args.command == 'export-static':
+            export_static_site(args)
         elif args.command == 'init':
             init_evidence_structure(args)
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else 1
     except KeyboardInterrupt:
         print("\n🛑 Operation cancelled by user")
-        sys.exit(1)
+        return 1
     except Exception as e:
         print(f"❌ Error: {e}")
-        sys.exit(1)
+        return 1
+    return 0
+
+def main():
+    """Main CLI entry point."""
+    sys.exit(run())
+
+def apply_config_defaults(args, config):
+    """Fill in options not given on the command line from the configuration."""
+    defaults = {
+        'evidence_root': config['default_evidence_root'],
+        'output_dir': config['default_output_dir'],
+        'host': config['web_server']['default_host'],
+        'port': config['web_server']['default_port'],
+    }
+    for name, value in defaults.items():
+        if getattr(args, name, value) is None:
+            setattr(args, name, value)
 
 def compile_evidence(args):
     """Compile evidence files."""
+    from evidence_compiler import MindseyeEvidenceCompiler
+    from mindseye_logging import flush_logging
+    from sharding import parse_shard
+    
     print("🧠 Mindseye Evidence Compiler")
     print("=" * 50)
     
+    shard = parse_shard(args.shard) if args.shard else None
+    
     # Create evidence root if it doesn't exist
     evidence_root = Path(args.evidence_root)
     if not evidence_root.exists():
@@ -100,19 +241,36 @@ def compile_evidence(args):
         evidence_root.mkdir(parents=True, exist_ok=True)
     
     # Initialize compiler
-    compiler = MindseyeEvidenceCompiler(str(evidence_root), args.output_dir)
+    compiler = MindseyeEvidenceCompiler(str(evidence_root), args.output_dir,
+                                        use_cache=not args.no_cache, shard=shard)
+    # Log records are written by a background thread; let them finish before printing
+    flush_logging()
+    if args.verbose:
+        # Per-file "Processing"/"Skipping" lines are logged at DEBUG
+        import logging
+        from mindseye_logging import LOGGER_NAME
+        logging.getLogger(LOGGER_NAME).setLevel(logging.DEBUG)
     
     print(f"📂 Evidence root: {evidence_root}")
     print(f"📤 Output directory: {args.output_dir}")
+    if shard:
+        print(f"🧩 Shard: {shard[0]} of {shard[1]}")
     print()
     
     # Run compilation
     print("🔍 Scanning for evidence files...")
     success = compiler.compile_evidence()
+    flush_logging()
     
     if success:
         print("✅ Compilation completed successfully!")
         
+        if shard:
+            print(f"📋 Shard log file: {compiler.log_file}")
+            print(f"🎯 Shard bubbles file: {compiler.bubbles_file}")
+            print("🔗 Run 'python mindseye_cli.py merge' once every shard has finished")
+            return
+        
         # Show results
         stats = compiler.get_compilation_stats()
         print(f"📊 Total bubbles: {stats.get('total_bubbles', 0)}")
@@ -123,13 +281,31 @@ def compile_evidence(args):
         print("❌ Compilation failed. Check logs for details.")
         sys.exit(1)
 
+def merge_shard_outputs(args):
+    """Merge shard outputs into the main bubbles file and log."""
+    from sharding import merge_shards
+    
+    print("🔗 Merging Mindseye Shard Outputs")
+    print("=" * 50)
+    
+    summary = merge_shards(args.output_dir, args.shards, args.allow_partial)
+    
+    print(f"🧩 Shards merged: {len(summary['merged_shards'])} of {summary['shard_count']}")
+    if summary['missing_shards']:
+        print(f"⚠️  Missing shards: {summary['missing_shards']}")
+    print(f"🎈 Bubbles: {summary['bubbles']}")
+    print(f"📋 New log entries: {summary['new_log_entries']}")
+    print("✅ Merge completed successfully!")
+
 def show_stats(args):
     """Show compilation statistics."""
+    from evidence_compiler import read_compilation_stats
+    from extractors import supported_extensions
+    
     print("📊 Mindseye Compilation Statistics")
     print("=" * 50)
     
-    compiler = MindseyeEvidenceCompiler(args.evidence_root, args.output_dir)
-    stats = compiler.get_compilation_stats()
+    stats = read_compilation_stats(args.output_dir, args.evidence_root)
     
     print(f"📂 Evidence root: {stats.get('evidence_root_exists', False)}")
     print(f"📤 Output directory: {args.output_dir}")
@@ -137,11 +313,18 @@ def show_stats(args):
     print(f"📋 Log file: {stats.get('log_file_exists', False)}")
     print(f"📄 Total processed files: {stats.get('total_processed_files', 0)}")
     print(f"🎈 Total bubbles: {stats.get('total_bubbles', 0)}")
+    print(f"💾 Total bytes processed: {stats.get('total_bytes', 0)}")
+    if 'last_run' in stats:
+        print(f"🕒 Last run: {stats['last_run']} ({stats.get('last_run_duration', 0)}s)")
+    for extension, breakdown in sorted(stats.get('extensions', {}).items()):
+        print(f"  {extension}: {breakdown['files']} files, {breakdown['bytes']} bytes")
     
     # Show evidence files if directory exists
     evidence_root = Path(args.evidence_root)
     if evidence_root.exists():
-        evidence_files = list(evidence_root.rglob("*.txt")) + list(evidence_root.rglob("*.md"))
+        file_types = supported_extensions(load_config()["supported_file_types"])
+        evidence_files = [file_path for file_path in evidence_root.rglob("*")
+                          if file_path.is_file() and file_path.suffix.lower() in file_types]
         print(f"📁 Evidence files found: {len(evidence_files)}")
         
         if evidence_files:
@@ -154,7 +337,114 @@ def show_stats(args):
 def start_server(args):
     """Start the web server."""
     from web_server import run_server
-    run_server(args.host, args.port)
+    run_server(args.host, args.port, open_browser=args.open)
+
+def manage_cache(args):
+    """Inspect, prune or clear the result cache."""
+    from result_cache import ResultCache, CACHE_FILENAME, DEFAULT_MAX_BYTES
+    
+    print("🗃️  Mindseye Result Cache")
+    print("=" * 50)
+    
+    cache_file = Path(args.output_dir) / CACHE_FILENAME
+    if not cache_file.exists():
+        print(f"📭 No cache found at {cache_file}")
+        return
+    
+    max_bytes = int(args.max_size * 1024 * 1024) if args.max_size is not None else DEFAULT_MAX_BYTES
+    with ResultCache(cache_file, max_bytes) as cache:
+        if args.clear:
+            print(f"🧹 Removed {cache.clear()} entries")
+        elif args.prune:
+            print(f"✂️  Evicted {cache.prune()} entries")
+        
+        stats = cache.get_stats()
+        print(f"📁 Cache file: {stats['cache_file']}")
+        print(f"📄 Entries: {stats['entries']}")
+        print(f"💾 Size: {stats['total_bytes'] / 1024:.1f} KB of {stats['max_bytes'] / (1024 * 1024):.1f} MB")
+        print(f"🎯 Lifetime hits: {stats['lifetime_hits']}")
+
+def compact_audit_log(args):
+    """Compact the audit log, keeping the latest entry per file."""
+    from log_index import compact_log
+    
+    print("🗜️  Compacting Mindseye Audit Log")
+    print("=" * 50)
+    
+    log_file = Path(args.output_dir) / "compiler_log.csv"
+    if not log_file.exists():
+        print(f"📋 No log file found at {log_file}")
+        return
+    
+    kept, archived, archive_path = compact_log(log_file, args.archive_dir)
+    print(f"📄 Entries kept: {kept}")
+    print(f"📦 Entries archived: {archived}")
+    if archive_path:
+        print(f"🗄️  Archive: {archive_path}")
+    else:
+        print("✅ Log already compact")
+
+def verify_evidence(args):
+    """Verify evidence against the published Merkle root or print an inclusion proof."""
+    import json
+    from merkle import inclusion_proof, verify_corpus
+    
+    if args.proof:
+        try:
+            proof = inclusion_proof(args.output_dir, args.proof)
+        except KeyError:
+            raise ValueError(f"{args.proof} is not in the published Merkle tree")
+        print(json.dumps(proof, indent=2))
+        return
+    
+    print("🔐 Verifying Mindseye Evidence")
+    print("=" * 50)
+    
+    report = verify_corpus(args.evidence_root, args.output_dir, args.prefix,
+                           args.expected_root, args.workers)
+    
+    print(f"🌳 Published root: {report['root']} ({report['published']})")
+    print(f"📄 Files re-hashed: {report['checked']} of {report['leaf_count']}")
+    if not report['snapshot_intact']:
+        print("⚠️  merkle_tree.json does not match its recorded root")
+    if not report['root_matches_expected']:
+        print("⚠️  Published root does not match --expected-root")
+    if not report['ledger_matches_snapshot']:
+        print("⚠️  compiler_log.csv has changed since the root was published")
+    for path in report['modified']:
+        print(f"  ✏️  Modified: {path}")
+    for path in report['missing']:
+        print(f"  ❓ Missing: {path}")
+    subtree = report['changed_subtree']
+    if subtree:
+        print(f"🔎 Changes confined to {subtree['leaves']} entries: "
+              f"{subtree['first_path']} .. {subtree['last_path']}")
+    
+    if report['ok']:
+        print("✅ Evidence matches the published root")
+    else:
+        print("❌ Verification failed")
+        sys.exit(1)
+
+def export_static_site(args):
+    """Write a static snapshot of the dashboard."""
+    from static_export import export_static
+    
+    print("📦 Exporting Static Mindseye Dashboard")
+    print("=" * 50)
+    
+    if args.chunk_size <= 0:
+        raise ValueError("--chunk-size must be positive")
+    summary = export_static(args.evidence_root, args.output_dir, args.dest, chunked=args.chunked,
+                            chunk_bytes=args.chunk_size * 1024, compress=not args.no_gzip)
+    
+    print(f"🎈 Bubbles: {summary['bubbles']}")
+    print(f"📄 Evidence files listed: {summary['files']}")
+    if args.chunked:
+        print(f"🧩 Data chunks: {summary['chunks']}")
+    print(f"🖼️  Images copied: {summary['assets_copied']}")
+    print(f"💾 Bytes written: {summary['bytes_written']}")
+    print(f"✅ Snapshot written to {summary['dest']} (open index.html, or serve the directory)")
 
 def init_evidence_structure(args):
     """Initialize evidence directory structure with sample files."""
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Mindseye Configuration
+Loads and validates config.json once for the compiler, CLI and web server.
+
+Author: AI Assistant
+Purpose: Single source of truth for Mindseye settings
+"""
+
+import copy
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List
+
+DEFAULT_CONFIG_FILE = Path(__file__).with_name("config.json")
+CONFIG_ENV_VAR = "MINDSEYE_CONFIG"
+
+DEFAULT_CONFIG = {
+    "default_evidence_root": "/evidence",
+    "default_output_dir": ".",
+    "supported_file_types": [".txt", ".md"],
+    "bubble_settings": {
+        "radius": 28,
+        "fontSize": 8,
+        "textColor": "yellow",
+        "font": "Trebuchet MS",
+        "glow": True,
+        "fixed": True,
+        "static": True,
+        "shape": "circle"
+    },
+    "compilation_settings": {
+        "max_description_length": 500,
+        "enable_url_extraction": True,
+        "enable_image_linking": True,
+        "hash_algorithm": "sha256",
+        "tag_dictionaries": ["dictionaries"],
+        "large_file_threshold_mb": 64,
+        "max_segment_chars": 2000000,
+        "min_segment_chars": 65536
+    },
+    "web_server": {
+        "default_host": "localhost",
+        "default_port": 8080,
+        "enable_cors": True
+    },
+    "logging": {
+        "level": "INFO",
+        "format": "%(asctime)s - %(levelname)s - %(message)s",
+        "file": "compiler.log",
+        "json": False,
+        "progress_interval": 10.0
+    }
+}
+
+_loaded: Dict[Path, Dict[str, Any]] = {}
+
+
+class ConfigError(ValueError):
+    """Raised when config.json is unreadable or contains invalid settings."""
+
+
+def _merge(defaults: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """Recursively overlay user settings on the defaults."""
+    merged = copy.deepcopy(defaults)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def hash_algorithms(config: Dict[str, Any]) -> List[str]:
+    """Configured hash algorithms, primary first (hash_algorithm may be a name or a list)."""
+    algorithms = config["compilation_settings"]["hash_algorithm"]
+    if isinstance(algorithms, str):
+        algorithms = [algorithms]
+    return [algorithm.lower() for algorithm in algorithms]
+
+
+def validate_hash_algorithm(algorithm: str):
+    """
+    Check that hashlib can compute a fixed-length hex digest for an algorithm.
+
+    Raises:
+        ConfigError: If the algorithm is unknown or variable-length (shake_*)
+    """
+    try:
+        hashlib.new(algorithm).hexdigest()
+    except (ValueError, TypeError):
+        raise ConfigError(f"Unsupported hash algorithm '{algorithm}'; "
+                          f"available: {', '.join(sorted(hashlib.algorithms_available))}")
+
+
+def _require(condition: bool, message: str):
+    if not condition:
+        raise ConfigError(message)
+
+
+def validate_config(config: Dict[str, Any]):
+    """
+    Validate a merged configuration.
+
+    Raises:
+        ConfigError: Describing the first invalid setting found
+    """
+    file_types = config["supported_file_types"]
+    _require(isinstance(file_types, list) and file_types
+             and all(isinstance(t, str) and t.startswith('.') for t in file_types),
+             "supported_file_types must be a non-empty list of extensions such as '.txt'")
+
+    bubble = config["bubble_settings"]
+    for key in ("radius", "fontSize"):
+        _require(isinstance(bubble[key], (int, float)) and not isinstance(bubble[key], bool)
+                 and bubble[key] > 0, f"bubble_settings.{key} must be a positive number")
+    for key in ("textColor", "font", "shape"):
+        _require(isinstance(bubble[key], str), f"bubble_settings.{key} must be a string")
+    for key in ("glow", "fixed", "static"):
+        _require(isinstance(bubble[key], bool), f"bubble_settings.{key} must be true or false")
+
+    compilation = config["compilation_settings"]
+    length = compilation["max_description_length"]
+    _require(isinstance(length, int) and not isinstance(length, bool) and length > 0,
+             "compilation_settings.max_description_length must be a positive integer")
+    for key in ("enable_url_extraction", "enable_image_linking"):
+        _require(isinstance(compilation[key], bool), f"compilation_settings.{key} must be true or false")
+    algorithms = compilation["hash_algorithm"]
+    _require(isinstance(algorithms, str) or (isinstance(algorithms, list) and algorithms
+                                             and all(isinstance(a, str) for a in algorithms)),
+             "compilation_settings.hash_algorithm must be an algorithm name or a list of names")
+    for algorithm in hash_algorithms(config):
+        validate_hash_algorithm(algorithm)
+    dictionaries = compilation["tag_dictionaries"]
+    _require(isinstance(dictionaries, list) and all(isinstance(d, str) for d in dictionaries),
+             "compilation_settings.tag_dictionaries must be a list of files or directories")
+    threshold = compilation["large_file_threshold_mb"]
+    _require(isinstance(threshold, (int, float)) and not isinstance(threshold, bool) and threshold > 0,
+             "compilation_settings.large_file_threshold_mb must be a positive number")
+    segment_chars = compilation["max_segment_chars"]
+    _require(isinstance(segment_chars, int) and not isinstance(segment_chars, bool) and segment_chars > 0,
+             "compilation_settings.max_segment_chars must be a positive integer")
+    min_segment_chars = compilation["min_segment_chars"]
+    _require(isinstance(min_segment_chars, int) and not isinstance(min_segment_chars, bool)
+             and min_segment_chars >= 0,
+             "compilation_settings.min_segment_chars must be a non-negative integer")
+
+    web = config["web_server"]
+    _require(isinstance(web["default_port"], int) and 0 < web["default_port"] < 65536,
+             "web_server.default_port must be a port number")
+    _require(isinstance(web["enable_cors"], bool), "web_server.enable_cors must be true or false")
+
+    log_settings = config["logging"]
+    _require(isinstance(log_settings["level"], str), "logging.level must be a level name")
+    _require(isinstance(log_settings["json"], bool), "logging.json must be true or false")
+    interval = log_settings["progress_interval"]
+    _require(isinstance(interval, (int, float)) and not isinstance(interval, bool) and interval > 0,
+             "logging.progress_interval must be a positive number of seconds")
+
+
+def load_config(config_file=None) -> Dict[str, Any]:
+    """
+    Load, merge with defaults and validate a configuration file.
+
+    Each file is read once per process; later calls return the same dict.
+    A missing file yields the defaults.
+
+    Args:
+        config_file: Path to config.json (default: $MINDSEYE_CONFIG, then
+            config.json next to this module)
+
+    Raises:
+        ConfigError: If the file cannot be parsed or fails validation
+    """
+    config_file = Path(config_file or os.environ.get(CONFIG_ENV_VAR) or DEFAULT_CONFIG_FILE).resolve()
+    if config_file in _loaded:
+        return _loaded[config_file]
+
+    overrides = {}
+    if config_file.exists():
+        try:
+            with open(config_file, 'r', encoding='utf-8') as f:
+                overrides = json.load(f).get("mindseye_config", {})
+        except (OSError, ValueError, AttributeError) as e:
+            raise ConfigError(f"Could not read {config_file}: {e}")
+
+    config = _merge(DEFAULT_CONFIG, overrides)
+    try:
+        validate_config(config)
+    except (KeyError, TypeError, ConfigError) as e:
+        raise ConfigError(f"Invalid configuration in {config_file}: {e}")
+    config["supported_file_types"] = [t.lower() for t in config["supported_file_types"]]
+    # Dictionary paths are relative to the config file, not the working directory
+    config["compilation_settings"]["tag_dictionaries"] = [
+        str(config_file.parent / path) for path in config["compilation_settings"]["tag_dictionaries"]
+    ]
+
+    _loaded[config_file] = config
+    return config
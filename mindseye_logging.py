@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Mindseye Logging
+Non-blocking compiler logging: records are queued and written by a background listener.
+
+Author: AI Assistant
+Purpose: Keep log I/O out of the compile loop and summarise per-file events
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+LOGGER_NAME = "mindseye"
+
+_lock = threading.Lock()
+_active = {"key": None, "listener": None, "handlers": []}
+
+
+class JsonLineFormatter(logging.Formatter):
+    """One JSON object per line; fields passed as extra={"fields": {...}} are merged in."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update(getattr(record, "fields", {}))
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def _stop():
+    """Drain the queue and close the active handlers."""
+    if _active["listener"] is not None:
+        _active["listener"].stop()
+    for handler in _active["handlers"]:
+        handler.close()
+    _active.update(key=None, listener=None, handlers=[])
+
+
+def setup_logging(log_settings: Dict[str, Any], output_dir=".") -> logging.Logger:
+    """
+    Route the 'mindseye' logger through a queue to the log file and stderr.
+
+    Callers only enqueue records; a listener thread formats and writes
+    them, so call flush_logging() before printing to the console. Safe to
+    call repeatedly (e.g. once per compile in the web server): handlers
+    are replaced only when the log file or format changes, and never
+    duplicated.
+
+    Args:
+        log_settings: The config's logging section (level, format, file, json)
+        output_dir: Directory the log file is written to
+
+    Returns:
+        The 'mindseye' logger
+    """
+    log_file = (Path(output_dir) / log_settings["file"]).resolve()
+    key = (log_file, log_settings["format"], log_settings["json"])
+
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(getattr(logging, log_settings["level"].upper(), logging.INFO))
+    logger.propagate = False
+
+    with _lock:
+        if _active["key"] != key:
+            _stop()
+            log_file.parent.mkdir(parents=True, exist_ok=True)
+            formatter = (JsonLineFormatter() if log_settings["json"]
+                         else logging.Formatter(log_settings["format"]))
+            handlers = [logging.FileHandler(log_file, encoding='utf-8'), logging.StreamHandler()]
+            for handler in handlers:
+                handler.setFormatter(formatter)
+
+            log_queue = queue.Queue(-1)  # unbounded, so logging never blocks
+            listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+            listener.start()
+            logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+            _active.update(key=key, listener=listener, handlers=handlers)
+    return logger
+
+
+def flush_logging():
+    """
+    Wait until every queued record has been written.
+
+    Lets the CLI print after logging without its lines landing in the
+    middle of records the listener is still writing.
+    """
+    with _lock:
+        if _active["listener"] is not None:
+            # stop() drains the queue; later records go to the restarted listener
+            _active["listener"].stop()
+            _active["listener"].start()
+
+
+def shutdown_logging():
+    """Flush queued records and stop the listener (also run at exit)."""
+    with _lock:
+        _stop()
+    logging.getLogger(LOGGER_NAME).handlers = []
+
+
+atexit.register(shutdown_logging)
+
+
+class ProgressReporter:
+    """
+    Counts per-file events and logs a summary at most every `interval` seconds.
+
+    Replaces one log line per file with one line per interval, so large
+    trees do not spend their time logging.
+    """
+
+    def __init__(self, logger: logging.Logger, total: int, interval: float = 10.0):
+        self.logger = logger
+        self.total = total
+        self.interval = interval
+        self.counts = {"processed": 0, "skipped": 0, "failed": 0}
+        self.started = time.monotonic()
+        self._next_report = self.started + interval
+
+    def record(self, event: str):
+        """Count one 'processed', 'skipped' or 'failed' file; report if the interval has passed."""
+        self.counts[event] += 1
+        now = time.monotonic()
+        if now >= self._next_report:
+            self._next_report = now + self.interval
+            self._report("Progress", now)
+
+    def finish(self, message: str = "Finished"):
+        """Log the final summary."""
+        self._report(message, time.monotonic())
+
+    def _report(self, label: str, now: float):
+        done = sum(self.counts.values())
+        elapsed = max(now - self.started, 1e-9)
+        rate = self.counts["processed"] / elapsed
+        self.logger.info(
+            "%s: %d/%d files (%d processed, %d skipped, %d failed), %.1f files/s",
+            label, done, self.total, self.counts["processed"], self.counts["skipped"],
+            self.counts["failed"], rate,
+            extra={"fields": dict(self.counts, event="progress", done=done, total=self.total,
+                                  elapsed=round(elapsed, 3), files_per_second=round(rate, 1))}
+        )
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Mindseye Result Cache
+Content-addressed cache of extraction results, keyed by file hash.
+
+Author: AI Assistant
+Purpose: Avoid re-reading and re-scanning evidence whose content has been seen before
+"""
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+CACHE_FILENAME = "result_cache.sqlite3"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Bump whenever the extracted features change shape so stale entries miss
+FEATURES_VERSION = 2
+
+
+class ResultCache:
+    """Size-bounded LRU cache of extracted features, stored in SQLite."""
+
+    def __init__(self, cache_file, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Open (or create) the cache.
+
+        Args:
+            cache_file: Path to the SQLite cache file
+            max_bytes: Total size of cached entries to keep before evicting
+        """
+        self.cache_file = Path(cache_file)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._conn = sqlite3.connect(str(self.cache_file))
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " hash TEXT PRIMARY KEY,"
+            " version INTEGER NOT NULL,"
+            " data TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created REAL NOT NULL,"
+            " last_used REAL NOT NULL,"
+            " hits INTEGER NOT NULL DEFAULT 0)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def get(self, file_hash: str) -> Optional[Dict[str, Any]]:
+        """Return cached features for a content hash, or None on a miss."""
+        row = self._conn.execute(
+            "SELECT data FROM results WHERE hash = ? AND version = ?",
+            (file_hash, FEATURES_VERSION)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self._conn.execute(
+            "UPDATE results SET last_used = ?, hits = hits + 1 WHERE hash = ?",
+            (time.time(), file_hash)
+        )
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, file_hash: str, features: Dict[str, Any]):
+        """Store features for a content hash."""
+        data = json.dumps(features, ensure_ascii=False)
+        now = time.time()
+        self._conn.execute(
+            "INSERT OR REPLACE INTO results (hash, version, data, size, created, last_used, hits)"
+            " VALUES (?, ?, ?, ?, ?, ?, 0)",
+            (file_hash, FEATURES_VERSION, data, len(data.encode('utf-8')), now, now)
+        )
+
+    def commit(self):
+        """Make entries written so far durable."""
+        self._conn.commit()
+
+    def total_size(self) -> int:
+        """Total size in bytes of all cached entries."""
+        return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+    def prune(self, max_bytes: Optional[int] = None) -> int:
+        """
+        Evict least recently used entries until the cache fits in max_bytes.
+
+        Entries from older feature versions are always removed.
+
+        Returns:
+            Number of entries evicted
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        evicted = self._conn.execute(
+            "DELETE FROM results WHERE version != ?", (FEATURES_VERSION,)
+        ).rowcount
+        excess = self.total_size() - max_bytes
+        if excess > 0:
+            victims = []
+            for file_hash, size in self._conn.execute(
+                    "SELECT hash, size FROM results ORDER BY last_used"):
+                if excess <= 0:
+                    break
+                victims.append((file_hash,))
+                excess -= size
+            self._conn.executemany("DELETE FROM results WHERE hash = ?", victims)
+            evicted += len(victims)
+        self._conn.commit()
+        return evicted
+
+    def clear(self) -> int:
+        """Remove every entry; returns the number removed."""
+        removed = self._conn.execute("DELETE FROM results").rowcount
+        self._conn.commit()
+        self._conn.execute("VACUUM")
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Summary of cache contents and this session's hit rate."""
+        entries, size, hits = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(hits), 0) FROM results"
+        ).fetchone()
+        return {
+            "cache_file": str(self.cache_file),
+            "entries": entries,
+            "total_bytes": size,
+            "max_bytes": self.max_bytes,
+            "lifetime_hits": hits,
+            "session_hits": self.hits,
+            "session_misses": self.misses,
+        }
+
+    def close(self):
+        """Evict down to the size bound, commit and close."""
+        if self._conn is None:
+            return
+        self.prune()
+        self._conn.close()
+        self._conn = None
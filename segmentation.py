@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Mindseye Segmentation
+Streaming, bounded-memory reading of very large evidence files as heading-delimited segments.
+
+Author: AI Assistant
+Purpose: Turn multi-gigabyte exports into one bubble per section instead of one unreadable bubble
+"""
+
+import codecs
+import re
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Section boundaries: Markdown headings ("## Ward 3") and banner lines
+# ("===== 2025-01-18 =====", "----- Night shift -----") common in log exports
+_HEADING_PATTERNS = [
+    re.compile(r"^#{1,6}\s+(?P<title>.+?)\s*#*\s*$"),
+    re.compile(r"^\s*(?P<rule>={3,}|-{3,}|\*{3,})\s*(?P<title>[^\s=*-].*?)\s*(?P=rule)[=*-]*\s*$"),
+]
+
+
+def heading_of(line: str) -> Optional[str]:
+    """The section title if the line is a heading, else None."""
+    line = line.rstrip("\r\n")
+    for pattern in _HEADING_PATTERNS:
+        match = pattern.match(line)
+        if match:
+            return match.group("title")
+    return None
+
+
+def iter_lines(file_path, hashers: Optional[Dict[str, Any]] = None,
+               chunk_size: int = STREAM_CHUNK_SIZE, max_line_chars: int = STREAM_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Decode a file line by line, reading it in fixed-size chunks.
+
+    Lines keep their line endings. Lines longer than max_line_chars are
+    cut, so a file without newlines still yields bounded pieces; only the
+    last piece of a cut line ends with its newline.
+
+    Text is decoded as UTF-8 (with or without BOM). From the first chunk
+    that is not valid UTF-8 onwards it is read as Windows-1252, which is
+    what extractors._decode does for a whole file.
+
+    Args:
+        file_path: File to read
+        hashers: Optional {name: hashlib object}, updated with every raw chunk
+            so the whole-file digests come from the same single read
+        chunk_size: Bytes read at a time
+        max_line_chars: Longest piece yielded
+    """
+    hashers = list((hashers or {}).values())
+    decoder = codecs.getincrementaldecoder('utf-8-sig')()
+    fallback = None
+    pending = ""
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            for hasher in hashers:
+                hasher.update(chunk)
+            if fallback is None:
+                try:
+                    text = decoder.decode(chunk)
+                except UnicodeDecodeError:
+                    fallback = codecs.getincrementaldecoder('cp1252')(errors='replace')
+                    text = fallback.decode(decoder.getstate()[0] + chunk)
+            else:
+                text = fallback.decode(chunk)
+            pending += text
+
+            start = 0
+            while True:
+                end = pending.find("\n", start)
+                if end < 0:
+                    break
+                line = pending[start:end + 1]
+                start = end + 1
+                while len(line) > max_line_chars:
+                    yield line[:max_line_chars]
+                    line = line[max_line_chars:]
+                yield line
+            pending = pending[start:]
+            while len(pending) > max_line_chars:
+                yield pending[:max_line_chars]
+                pending = pending[max_line_chars:]
+
+    pending += fallback.decode(b"", final=True) if fallback else decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+def iter_segments(lines: Iterable[str], max_chars: int, min_chars: int = 0) -> Iterator[Dict[str, Any]]:
+    """
+    Group lines into segments that start at headings.
+
+    A segment longer than max_chars is continued in a new segment with
+    the same heading, so at most about max_chars of text is held at once.
+    A heading only starts a new segment once the current one has at least
+    min_chars; before that it is merged into the current segment, so logs
+    with a banner per entry do not become one segment per entry.
+    A piece without a trailing newline is part of a line that was cut
+    (see iter_lines): line numbers only advance at real newlines, and the
+    pieces that continue a line are never taken as headings.
+
+    Yields:
+        {"index", "heading" (None before the first heading), "part" (1 for
+        the first piece of a section), "text", "line_start", "line_end"}
+        with 1-based, inclusive line numbers
+    """
+    index = 0
+    heading, part = None, 1
+    buffer, size, has_text = [], 0, False
+    line_start = line_end = line_number = 1
+    at_line_start = True
+
+    def segment():
+        return {"index": index, "heading": heading, "part": part, "text": "".join(buffer),
+                "line_start": line_start, "line_end": line_end}
+
+    for piece in lines:
+        title = heading_of(piece) if at_line_start else None
+        if title is not None and has_text and size < min_chars:
+            title = None
+        if title is not None or (buffer and size + len(piece) > max_chars):
+            if has_text:
+                yield segment()
+                index += 1
+            if title is not None:
+                heading, part = title, 1
+            elif buffer:
+                part += 1
+            buffer, size, has_text, line_start = [], 0, False, line_number
+        buffer.append(piece)
+        size += len(piece)
+        has_text = has_text or not piece.isspace()
+        line_end = line_number
+        at_line_start = piece.endswith("\n")
+        if at_line_start:
+            line_number += 1
+
+    if has_text:
+        yield segment()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Mindseye Sharded Compilation
+Deterministic partitioning of the evidence tree and merging of shard outputs.
+
+Author: AI Assistant
+Purpose: Let several processes or machines compile one archive in parallel
+"""
+
+import csv
+import hashlib
+import json
+import re
+from pathlib import Path, PurePath
+from typing import Any, Dict, List, Optional, Tuple
+
+_SHARD_FILE_PATTERN = re.compile(r'^bubbles\.shard-(\d+)-of-(\d+)\.json$')
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """
+    Parse a shard spec of the form 'i/N' (0 <= i < N).
+
+    Raises:
+        ValueError: If the spec is malformed or out of range
+    """
+    match = re.fullmatch(r'\s*(\d+)\s*/\s*(\d+)\s*', value)
+    if not match:
+        raise ValueError(f"Invalid shard '{value}', expected i/N")
+    index, count = int(match.group(1)), int(match.group(2))
+    if count < 1 or index >= count:
+        raise ValueError(f"Invalid shard '{value}', index must be in 0..{max(count - 1, 0)}")
+    return index, count
+
+
+def shard_suffix(shard: Optional[Tuple[int, int]]) -> str:
+    """Filename suffix for a shard's outputs ('' when not sharded)."""
+    if shard is None:
+        return ""
+    return f".shard-{shard[0]}-of-{shard[1]}"
+
+
+def shard_of(relative_path, count: int) -> int:
+    """
+    Assign a file to a shard by hashing its path relative to the evidence root.
+
+    Paths are normalised to POSIX form so every host agrees on the partition.
+    """
+    key = PurePath(relative_path).as_posix().encode('utf-8')
+    return int.from_bytes(hashlib.sha1(key).digest()[:8], 'big') % count
+
+
+def find_shard_outputs(output_dir) -> Dict[int, List[int]]:
+    """Return {shard count: [shard indexes present]} for shard outputs in output_dir."""
+    found = {}
+    for path in Path(output_dir).iterdir():
+        match = _SHARD_FILE_PATTERN.match(path.name)
+        if match:
+            found.setdefault(int(match.group(2)), []).append(int(match.group(1)))
+    return {count: sorted(indexes) for count, indexes in found.items()}
+
+
+def merge_shards(output_dir=".", shard_count: Optional[int] = None,
+                 allow_partial: bool = False) -> Dict[str, Any]:
+    """
+    Combine shard outputs into bubbles.json, compiler_log.csv and the stats sidecar.
+
+    Only shard outputs are read; evidence files are never touched. Ledger
+    rows already present in the main log (same filename and hash) are
+    skipped, new rows are appended in timestamp order, and the shard
+    outputs are removed once merged.
+
+    Args:
+        output_dir: Directory holding the shard outputs and the main outputs
+        shard_count: Which N to merge if outputs for several shard counts exist
+        allow_partial: Merge even if some shards of N are missing
+
+    Returns:
+        Summary of the merge
+
+    Raises:
+        ValueError: If no shard outputs are found, the shard count is
+            ambiguous, or shards are missing and allow_partial is False
+    """
+    # Imported here to avoid a circular import with evidence_compiler
+    from evidence_compiler import STATS_FILENAME, _write_json_atomic, load_stats_sidecar
+    from log_index import LOG_FIELDS, AuditLogIndex, upgrade_log_schema
+    from merkle import publish_root
+    from tagging import TAG_INDEX_FILENAME, update_tag_index
+    from timeline import TIMELINE_FILENAME, update_timeline
+
+    output_dir = Path(output_dir)
+    available = find_shard_outputs(output_dir)
+    if not available:
+        raise ValueError(f"No shard outputs found in {output_dir}")
+    if shard_count is None:
+        if len(available) > 1:
+            raise ValueError(f"Shard outputs for several shard counts found: {sorted(available)}")
+        shard_count = next(iter(available))
+    indexes = available.get(shard_count, [])
+    missing = sorted(set(range(shard_count)) - set(indexes))
+    if missing and not allow_partial:
+        raise ValueError(f"Missing outputs for shard(s) {missing} of {shard_count}")
+
+    main_log = output_dir / "compiler_log.csv"
+    upgrade_log_schema(main_log)
+    fieldnames = LOG_FIELDS
+    ledger = set()
+    if main_log.exists():
+        with open(main_log, 'r', newline='', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            fieldnames = reader.fieldnames or fieldnames
+            for row in reader:
+                ledger.add((row['filename'], row['hash']))
+
+    bubbles = []
+    new_rows = []
+    sidecar = load_stats_sidecar(output_dir)
+    merged_files = []
+    durations = []
+    for index in indexes:
+        suffix = shard_suffix((index, shard_count))
+        bubbles_file = output_dir / f"bubbles{suffix}.json"
+        log_file = output_dir / f"compiler_log{suffix}.csv"
+        stats_file = output_dir / f"compiler_stats{suffix}.json"
+
+        with open(bubbles_file, 'r', encoding='utf-8') as f:
+            bubbles.extend(json.load(f))
+
+        if log_file.exists():
+            with open(log_file, 'r', newline='', encoding='utf-8') as f:
+                for row in csv.DictReader(f):
+                    key = (row['filename'], row['hash'])
+                    if key not in ledger:
+                        ledger.add(key)
+                        new_rows.append(row)
+
+        shard_stats = load_stats_sidecar(output_dir, suffix)
+        sidecar["total_bytes"] = sidecar.get("total_bytes", 0) + shard_stats.get("total_bytes", 0)
+        for extension, breakdown in shard_stats.get("extensions", {}).items():
+            merged = sidecar.setdefault("extensions", {}).setdefault(extension, {"files": 0, "bytes": 0})
+            merged["files"] += breakdown["files"]
+            merged["bytes"] += breakdown["bytes"]
+        for key in ("last_run", "last_compilation"):
+            if shard_stats.get(key, "") > sidecar.get(key, ""):
+                sidecar[key] = shard_stats[key]
+        durations.append(shard_stats.get("last_run_duration", 0))
+        if "evidence_root" in shard_stats:
+            sidecar["evidence_root"] = shard_stats["evidence_root"]
+
+        merged_files.extend([bubbles_file, log_file, stats_file,
+                             AuditLogIndex(log_file).index_file])
+
+    # Shards run in parallel, so the run took as long as the slowest shard
+    if durations:
+        sidecar["last_run_duration"] = max(durations)
+
+    # Append new ledger rows in timestamp order so the log stays sorted
+    new_rows.sort(key=lambda row: row.get('timestamp', ''))
+    log_exists = main_log.exists()
+    if not log_exists and AuditLogIndex(main_log).index_file.exists():
+        AuditLogIndex(main_log).index_file.unlink()
+    with open(main_log, 'a', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+        if not log_exists:
+            writer.writeheader()
+        writer.writerows(new_rows)
+    AuditLogIndex(main_log).refresh()
+
+    if bubbles:
+        _write_json_atomic(output_dir / "bubbles.json", bubbles)
+        sidecar["total_bubbles"] = len(bubbles)
+        update_tag_index(output_dir / TAG_INDEX_FILENAME,
+                         {bubble["path"]: bubble.get("tags", []) for bubble in bubbles
+                          if "path" in bubble})
+        update_timeline(output_dir / TIMELINE_FILENAME,
+                        {bubble["path"]: bubble.get("incidentDate") for bubble in bubbles
+                         if "path" in bubble})
+    sidecar["total_processed_files"] = len({filename for filename, _ in ledger})
+    sidecar["merkle_root"] = publish_root(output_dir)["root"]
+    _write_json_atomic(output_dir / STATS_FILENAME, sidecar)
+
+    for path in merged_files:
+        if path.exists():
+            path.unlink()
+
+    return {
+        "shard_count": shard_count,
+        "merged_shards": indexes,
+        "missing_shards": missing,
+        "bubbles": len(bubbles),
+        "new_log_entries": len(new_rows),
+    }
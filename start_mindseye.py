@@ -7,15 +7,18 @@ Author: AI Assistant
 Purpose: Easy startup for Maya Patterson's evidence management needs
 """
 
-import os
-import sys
-import subprocess
-import webbrowser
-import time
+import argparse
 from pathlib import Path
 
+from mindseye_cli import run
+
 def main():
-    """Main startup function."""
+    """Main startup function (every step runs in this process)."""
+    parser = argparse.ArgumentParser(description="Mindseye Evidence Compiler - Startup")
+    parser.add_argument("--port", type=int, default=8080, help="Port to serve the dashboard on")
+    parser.add_argument("--no-browser", action="store_true", help="Do not open a browser")
+    args = parser.parse_args()
+    
     print("🧠 Mindseye Evidence Compiler - Startup")
     print("=" * 50)
     
@@ -23,7 +26,7 @@ def main():
     evidence_dir = Path("evidence")
     if not evidence_dir.exists():
         print("📁 Creating evidence directory structure...")
-        subprocess.run([sys.executable, "mindseye_cli.py", "init", "--evidence-root", "evidence"])
+        run(["init", "--evidence-root", "evidence"])
     
     # Compile evidence if needed
     print("🔍 Checking for evidence files...")
@@ -32,47 +35,30 @@ def main():
     if evidence_files:
         print(f"📄 Found {len(evidence_files)} evidence files")
         print("🔧 Compiling evidence...")
-        result = subprocess.run([
-            sys.executable, "mindseye_cli.py", "compile", 
-            "--evidence-root", "evidence", "--output-dir", "."
-        ], capture_output=True, text=True)
-        
-        if result.returncode == 0:
+        if run(["compile", "--evidence-root", "evidence", "--output-dir", "."]) == 0:
             print("✅ Evidence compiled successfully!")
         else:
-            print("❌ Compilation failed:")
-            print(result.stderr)
+            print("❌ Compilation failed. Check compiler.log for details.")
     else:
         print("📝 No evidence files found. Add .txt or .md files to the evidence/ directory.")
     
     # Show statistics
     print("\n📊 Current Statistics:")
-    subprocess.run([sys.executable, "mindseye_cli.py", "stats", "--evidence-root", "evidence"])
+    run(["stats", "--evidence-root", "evidence"])
     
     # Start web server
     print("\n🌐 Starting web interface...")
-    print("📱 The web interface will open in your browser")
+    if not args.no_browser:
+        print("📱 The web interface will open in your browser")
     print("⏹️  Press Ctrl+C to stop the server")
     print("-" * 50)
     
-    try:
-        # Open browser after a short delay
-        def open_browser():
-            time.sleep(2)
-            webbrowser.open("http://localhost:8080")
-        
-        import threading
-        browser_thread = threading.Thread(target=open_browser)
-        browser_thread.daemon = True
-        browser_thread.start()
-        
-        # Start the web server
-        subprocess.run([sys.executable, "mindseye_cli.py", "serve", "--port", "8080"])
-        
-    except KeyboardInterrupt:
-        print("\n🛑 Server stopped by user")
-    except Exception as e:
-        print(f"❌ Error starting server: {e}")
+    serve_args = ["serve", "--port", str(args.port)]
+    if not args.no_browser:
+        # Opened as soon as the server is listening
+        serve_args.append("--open")
+    if run(serve_args) != 0:
+        print("❌ Error starting server")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Mindseye Static Export
+Self-contained snapshots of the dashboard that need no Python process to view.
+
+Author: AI Assistant
+Purpose: Share a compiled evidence view as plain files for any static host or a local disk
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+# index.html marks where a snapshot's data (or its chunk manifest) is inserted
+STATIC_DATA_MARKER = "<!-- mindseye:static-data -->"
+TEMPLATE_FILE = Path(__file__).resolve().parent / "index.html"
+
+DATA_DIR = "data"
+DEFAULT_CHUNK_BYTES = 256 * 1024
+HASH_LENGTH = 12
+
+# Pre-compressed copies are written for text files; images are already compressed
+GZIP_SUFFIXES = {".html", ".js"}
+GZIP_LEVEL = 9
+
+
+def collect_snapshot(evidence_root, output_dir) -> Dict[str, Any]:
+    """
+    Gather what the dashboard fetches from /api/bubbles, /api/files and /api/stats.
+
+    Returns:
+        {"bubbles": [...], "files": [...], "stats": {...}}
+    """
+    from evidence_compiler import read_compilation_stats
+    from extractors import supported_extensions
+    from mindseye_config import load_config
+    from web_server import list_evidence_files
+
+    evidence_root, output_dir = Path(evidence_root), Path(output_dir)
+
+    bubbles_file = output_dir / "bubbles.json"
+    bubbles = []
+    if bubbles_file.exists():
+        with open(bubbles_file, 'r', encoding='utf-8') as f:
+            bubbles = json.load(f)
+
+    file_types = supported_extensions(load_config()["supported_file_types"])
+    files = list_evidence_files(evidence_root, file_types) if evidence_root.exists() else []
+
+    stats = read_compilation_stats(output_dir, evidence_root)
+    stats["evidence_root"] = str(evidence_root)
+    stats["last_compilation"] = stats.get("last_compilation", "Never")
+
+    return {"bubbles": bubbles, "files": files, "stats": stats}
+
+
+def _script_json(data: Any) -> str:
+    """JSON that is safe inside an inline <script> element."""
+    text = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    # '<' only occurs inside JSON strings, where '\/' is an equivalent escape
+    return (text.replace("</", "<\\/").replace("<!--", "<\\!--")
+            .replace("\u2028", "\\u2028").replace("\u2029", "\\u2029"))
+
+
+def split_chunks(data: Any, chunk_bytes: int) -> List[Any]:
+    """
+    Split a dataset into parts of roughly chunk_bytes of JSON each.
+
+    Lists are split between items (a single oversized item gets its own
+    part); other values are kept whole.
+    """
+    if not isinstance(data, list):
+        return [data]
+    chunks, current, size = [], [], 0
+    for item in data:
+        item_size = len(json.dumps(item, ensure_ascii=False, separators=(',', ':')).encode('utf-8')) + 1
+        if current and size + item_size > chunk_bytes:
+            chunks.append(current)
+            current, size = [], 0
+        current.append(item)
+        size += item_size
+    if current or not chunks:
+        chunks.append(current)
+    return chunks
+
+
+def _write_file(path: Path, content: bytes, compress: bool) -> int:
+    """Write a file and, for text assets, its .gz twin; returns bytes written."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    written = len(content)
+    gz_path = path.with_name(path.name + ".gz")
+    if compress and path.suffix in GZIP_SUFFIXES:
+        # mtime=0 keeps the .gz identical for identical content
+        buffer = io.BytesIO()
+        with gzip.GzipFile(fileobj=buffer, mode='wb', compresslevel=GZIP_LEVEL, mtime=0) as f:
+            f.write(content)
+        compressed = buffer.getvalue()
+        gz_path.write_bytes(compressed)
+        written += len(compressed)
+    elif gz_path.exists():
+        # A .gz left by an earlier export would be served instead of the new file
+        gz_path.unlink()
+    return written
+
+
+def _copy_assets(bubbles: List[Dict[str, Any]], evidence_root: Path, output_dir: Path,
+                 dest: Path) -> int:
+    """Copy the images and thumbnails the bubbles reference; returns the number copied."""
+    copied = 0
+    for bubble in bubbles:
+        for key, base_dir in (("image", evidence_root), ("thumbnail", output_dir)):
+            relative = bubble.get(key)
+            if not relative:
+                continue
+            source, target = base_dir / relative, dest / relative
+            if not source.is_file() or dest.resolve() not in target.resolve().parents:
+                continue
+            if target.exists() and target.stat().st_size == source.stat().st_size \
+                    and target.stat().st_mtime >= source.stat().st_mtime:
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source, target)
+            copied += 1
+    return copied
+
+
+def export_static(evidence_root, output_dir, dest, chunked: bool = False,
+                  chunk_bytes: int = DEFAULT_CHUNK_BYTES, compress: bool = True) -> Dict[str, Any]:
+    """
+    Write a static snapshot of the dashboard to dest.
+
+    The snapshot is index.html with the data inserted, the images and
+    thumbnails the bubbles use, and (with compress) a .gz copy of every
+    text file for servers that serve pre-compressed files. By default the
+    data is embedded in the page. With chunked it goes into
+    data/<name>.<hash>.js scripts named by content hash, so they can be
+    cached forever and re-exports only change the chunks that changed.
+    Chunks are scripts rather than JSON files so the page also works when
+    opened from disk, where browsers refuse fetch().
+
+    Args:
+        evidence_root: Evidence directory (file list, images)
+        output_dir: Compiler output directory (bubbles.json, stats, thumbnails)
+        dest: Directory to write the snapshot to
+        chunked: Split the data into hashed chunk files instead of embedding it
+        chunk_bytes: Target size of each chunk's JSON
+        compress: Also write .gz variants
+
+    Returns:
+        Summary with the counts and bytes written
+    """
+    evidence_root, output_dir, dest = Path(evidence_root), Path(output_dir), Path(dest)
+    if dest.resolve() == TEMPLATE_FILE.parent:
+        raise ValueError(f"Refusing to export into {dest}: it would overwrite the dashboard template")
+
+    template = TEMPLATE_FILE.read_text(encoding='utf-8')
+    if STATIC_DATA_MARKER not in template:
+        raise ValueError(f"{TEMPLATE_FILE} has no {STATIC_DATA_MARKER} marker")
+
+    snapshot = collect_snapshot(evidence_root, output_dir)
+    manifest = {"exported": datetime.now().isoformat(), "data": {}, "chunks": {}, "parts": {}}
+    data_dir = dest / DATA_DIR
+    written_chunks = set()
+    total_bytes = 0
+
+    if chunked:
+        for name, data in snapshot.items():
+            manifest["chunks"][name] = []
+            for index, part in enumerate(split_chunks(data, chunk_bytes)):
+                content = (f"MINDSEYE_STATIC.parts[{json.dumps(f'{name}/{index}')}] = "
+                           f"{_script_json(part)};\n").encode('utf-8')
+                digest = hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+                chunk_name = f"{name}.{digest}.js"
+                # Same name, same content: unchanged chunks keep their files (and caches)
+                chunk_path = data_dir / chunk_name
+                gz_path = data_dir / f"{chunk_name}.gz"
+                if not chunk_path.exists() or compress != gz_path.exists():
+                    total_bytes += _write_file(chunk_path, content, compress)
+                manifest["chunks"][name].append(f"{DATA_DIR}/{chunk_name}")
+                written_chunks.add(chunk_name)
+    else:
+        manifest["data"] = snapshot
+
+    # Chunks from earlier exports are no longer referenced
+    if data_dir.is_dir():
+        for stale in data_dir.iterdir():
+            name = stale.name[:-len(".gz")] if stale.name.endswith(".gz") else stale.name
+            if name not in written_chunks:
+                stale.unlink()
+        if not written_chunks:
+            data_dir.rmdir()
+
+    page = template.replace(STATIC_DATA_MARKER,
+                            f"<script>window.MINDSEYE_STATIC = {_script_json(manifest)};</script>", 1)
+    total_bytes += _write_file(dest / "index.html", page.encode('utf-8'), compress)
+    assets = _copy_assets(snapshot["bubbles"], evidence_root, output_dir, dest)
+
+    return {
+        "dest": str(dest),
+        "bubbles": len(snapshot["bubbles"]),
+        "files": len(snapshot["files"]),
+        "chunks": len(written_chunks),
+        "assets_copied": assets,
+        "bytes_written": total_bytes,
+    }
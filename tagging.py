@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Mindseye Tagging
+Dictionary-based tagging of evidence text with an Aho-Corasick automaton.
+
+Author: AI Assistant
+Purpose: Tag bubbles with medications, ward codes, staff roles and safeguarding terms
+"""
+
+import hashlib
+import json
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+TAG_INDEX_FILENAME = "tag_index.json"
+DICTIONARY_SUFFIX = ".txt"
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick automaton over lower-cased terms.
+
+    Every term is found in one pass over the text, however many terms
+    there are; the cost is linear in the text plus the number of matches.
+    """
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        self._lengths: List[int] = []
+        self._built = False
+
+    def add(self, term: str) -> int:
+        """Add a term; returns its id. Terms cannot be added after build()."""
+        if self._built:
+            raise RuntimeError("Automaton already built")
+        state = 0
+        for char in term.lower():
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        term_id = len(self._lengths)
+        self._lengths.append(len(term.lower()))
+        self._output[state].append(term_id)
+        return term_id
+
+    def build(self):
+        """Compute failure links breadth-first and fold in inherited outputs."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+        self._built = True
+
+    def find(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """Yield (start, end, term id) for every match in lower-cased text."""
+        if not self._built:
+            self.build()
+        goto, fail, output, lengths = self._goto, self._fail, self._output, self._lengths
+        state = 0
+        for end, char in enumerate(text, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for term_id in output[state]:
+                yield end - lengths[term_id], end, term_id
+
+
+class Tagger:
+    """Tags text with 'category:term' for every dictionary term it contains."""
+
+    def __init__(self, dictionaries: Dict[str, Iterable[str]]):
+        """
+        Build the automaton once for all dictionaries.
+
+        Args:
+            dictionaries: {category: terms}; matching ignores case and only
+                counts whole words
+        """
+        self.automaton = AhoCorasick()
+        self.tags: List[str] = []
+        seen = {}
+        for category in sorted(dictionaries):
+            for term in dictionaries[category]:
+                key = (category, term.lower())
+                if key not in seen:
+                    seen[key] = self.automaton.add(term)
+                    self.tags.append(f"{category}:{term}")
+        self.automaton.build()
+        self.signature = hashlib.sha256("\n".join(self.tags).encode('utf-8')).hexdigest()[:16]
+
+    def __len__(self) -> int:
+        return len(self.tags)
+
+    def tag(self, text: str) -> List[str]:
+        """Sorted tags whose terms occur in the text as whole words."""
+        if not self.tags:
+            return []
+        text = text.lower()
+        found = set()
+        for start, end, term_id in self.automaton.find(text):
+            if ((start == 0 or not text[start - 1].isalnum())
+                    and (end == len(text) or not text[end].isalnum())):
+                found.add(term_id)
+        return sorted(self.tags[term_id] for term_id in found)
+
+
+def dictionary_files(paths: Iterable[str]) -> List[Path]:
+    """Expand configured dictionary paths; directories contribute their *.txt files."""
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(path.glob(f"*{DICTIONARY_SUFFIX}")))
+        elif path.is_file():
+            files.append(path)
+    return files
+
+
+def load_dictionaries(paths: Iterable[str]) -> Dict[str, List[str]]:
+    """
+    Read dictionary files: one term per line, '#' starts a comment.
+
+    The category of each term is the file name without its extension,
+    e.g. medications.txt tags 'medications:Morphine'.
+    """
+    dictionaries = {}
+    for file_path in dictionary_files(paths):
+        with open(file_path, 'r', encoding='utf-8-sig') as f:
+            terms = [line.split('#', 1)[0].strip() for line in f]
+        dictionaries.setdefault(file_path.stem, []).extend(term for term in terms if term)
+    return dictionaries
+
+
+def load_tagger(paths: Iterable[str]) -> Tagger:
+    """Build a Tagger from dictionary files or directories."""
+    return Tagger(load_dictionaries(paths))
+
+
+def load_tag_index(index_file) -> Dict[str, List[str]]:
+    """Load {tag: [document paths]} ({} if there is no index yet)."""
+    index_file = Path(index_file)
+    if not index_file.exists():
+        return {}
+    with open(index_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def update_tag_index(index_file, documents: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """
+    Replace the tags of the given documents in the tag index and save it atomically.
+
+    Args:
+        index_file: Path to tag_index.json
+        documents: {document path: tags} for documents (re)processed this run
+    """
+    from evidence_compiler import _write_json_atomic
+
+    index = {}
+    for tag, paths in load_tag_index(index_file).items():
+        kept = [path for path in paths if path not in documents]
+        if kept:
+            index[tag] = kept
+    for path, tags in documents.items():
+        for tag in tags:
+            index.setdefault(tag, []).append(path)
+    index = {tag: sorted(paths) for tag, paths in sorted(index.items())}
+    _write_json_atomic(index_file, index)
+    return index
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Crash/resume tests for the compiler's write-ahead journal
+
+Run with: python -m pytest test_compile_journal.py (or python test_compile_journal.py)
+"""
+
+import csv
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from evidence_compiler import MindseyeEvidenceCompiler
+from mindseye_config import load_config
+from mindseye_logging import shutdown_logging
+
+
+class Crash(Exception):
+    """Stands in for the process being killed."""
+
+
+class CompileJournalTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.evidence = self.root / "evidence"
+        self.output = self.root / "output"
+        self.evidence.mkdir()
+        self.output.mkdir()
+        config_file = self.root / "config.json"
+        config_file.write_text(json.dumps({"mindseye_config": {"supported_file_types": [".txt"]}}))
+        self.config = load_config(config_file)
+
+    def tearDown(self):
+        shutdown_logging()
+        self._tmp.cleanup()
+
+    def add_file(self, name, text):
+        (self.evidence / name).write_text(text, encoding='utf-8')
+
+    def compile(self, crash_after_checkpoints=None):
+        """Run a compile, optionally killing it right after its Nth checkpoint (before the stats are saved)."""
+        compiler = MindseyeEvidenceCompiler(str(self.evidence), str(self.output), use_cache=False,
+                                            checkpoint_interval=1, config=self.config)
+        if crash_after_checkpoints is not None:
+            checkpoint = compiler._checkpoint
+
+            def crash_after_checkpoint(*args):
+                checkpoint(*args)
+                if compiler._checkpoints >= crash_after_checkpoints:
+                    raise Crash()
+            compiler._checkpoint = crash_after_checkpoint
+        return compiler.compile_evidence()
+
+    def logged_files(self):
+        with open(self.output / "compiler_log.csv", 'r', encoding='utf-8') as f:
+            return [row["filename"] for row in csv.DictReader(f)]
+
+    def bubble_files(self):
+        with open(self.output / "bubbles.json", 'r', encoding='utf-8') as f:
+            return [bubble["path"] for bubble in json.load(f) if "path" in bubble]
+
+    def stats(self):
+        with open(self.output / "compiler_stats.json", 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def assert_consistent(self):
+        """Every logged file has exactly one bubble and is counted once in the stats."""
+        files = sorted(path.name for path in self.evidence.iterdir())
+        self.assertEqual(sorted(self.logged_files()), files)
+        self.assertEqual(sorted(self.bubble_files()), files)
+        stats = self.stats()
+        total_bytes = sum(path.stat().st_size for path in self.evidence.iterdir())
+        self.assertEqual(stats["total_processed_files"], len(files))
+        self.assertEqual(stats["total_bytes"], total_bytes)
+        self.assertEqual(stats["extensions"], {".txt": {"files": len(files), "bytes": total_bytes}})
+
+    def test_resume_after_crash(self):
+        for name in ("a.txt", "b.txt", "c.txt"):
+            self.add_file(name, f"Evidence in {name}\n")
+        with self.assertRaises(Crash):
+            self.compile(crash_after_checkpoints=2)
+        self.assertEqual(len(self.logged_files()), 2)
+
+        self.assertTrue(self.compile())
+        self.assert_consistent()
+        self.assertFalse((self.output / "compile_journal.jsonl").exists())
+
+    def test_crash_between_log_and_stats_is_counted(self):
+        for name in ("a.txt", "b.txt"):
+            self.add_file(name, f"Evidence in {name}\n" * 10)
+        # The second checkpoint's rows are logged but never reach the stats sidecar
+        with self.assertRaises(Crash):
+            self.compile(crash_after_checkpoints=2)
+
+        self.assertTrue(self.compile())
+        self.assert_consistent()
+
+    def test_torn_journal_line_then_second_crash(self):
+        for name in ("a.txt", "b.txt", "c.txt"):
+            self.add_file(name, f"Evidence in {name}\n")
+        with self.assertRaises(Crash):
+            self.compile(crash_after_checkpoints=2)
+        journal = self.output / "compile_journal.jsonl"
+        with open(journal, 'a', encoding='utf-8') as f:
+            f.write('{"bubbles": [{"title": "c')  # killed mid-write
+
+        # The resumed run is killed again after checkpointing a new file
+        self.add_file("d.txt", "Evidence in d.txt\n")
+        with self.assertRaises(Crash):
+            self.compile(crash_after_checkpoints=3)
+        for line in journal.read_text(encoding='utf-8').splitlines():
+            json.loads(line)
+
+        self.assertTrue(self.compile())
+        self.assert_consistent()
+
+    def test_crash_inside_segmented_file(self):
+        self.config["compilation_settings"].update(large_file_threshold_mb=0.001, min_segment_chars=0)
+        self.add_file("a.txt", "Evidence in a.txt\n")
+        self.add_file("big.txt", "".join(f"## Entry {i}\nNurse report {i}\n" for i in range(50)))
+        # Children of big.txt are journaled before its row; killed mid-file
+        with self.assertRaises(Crash):
+            self.compile(crash_after_checkpoints=3)
+
+        self.assertTrue(self.compile())
+        with open(self.output / "bubbles.json", 'r', encoding='utf-8') as f:
+            bubbles = json.load(f)
+        children = [bubble["segment"]["index"] for bubble in bubbles if bubble.get("parent") == "big.txt"]
+        self.assertEqual(sorted(children), list(range(50)))
+        self.assertEqual(sorted(self.logged_files()), ["a.txt", "big.txt"])
+        self.assertEqual(sorted(self.bubble_files()), ["a.txt", "big.txt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,10 +14,13 @@ def test_web_interface():
     print("🧪 Testing Mindseye Web Interface")
     print("=" * 50)
     
+    # Reuse one keep-alive connection for every request, like the dashboard does
+    session = requests.Session()
+    
     try:
         # Test main page
         print("1. Testing main page...")
-        response = requests.get(f"{base_url}/")
+        response = session.get(f"{base_url}/")
         if response.status_code == 200:
             print("✅ Main page loads successfully")
         else:
@@ -26,7 +29,7 @@ def test_web_interface():
         
         # Test stats endpoint
         print("2. Testing stats endpoint...")
-        response = requests.get(f"{base_url}/api/stats")
+        response = session.get(f"{base_url}/api/stats")
         if response.status_code == 200:
             stats = response.json()
             print(f"✅ Stats loaded: {stats}")
@@ -35,7 +38,7 @@ def test_web_interface():
         
         # Test bubbles endpoint
         print("3. Testing bubbles endpoint...")
-        response = requests.get(f"{base_url}/api/bubbles")
+        response = session.get(f"{base_url}/api/bubbles")
         if response.status_code == 200:
             bubbles = response.json()
             print(f"✅ Bubbles loaded: {len(bubbles)} bubbles found")
@@ -44,7 +47,7 @@ def test_web_interface():
         
         # Test files endpoint
         print("4. Testing files endpoint...")
-        response = requests.get(f"{base_url}/api/files")
+        response = session.get(f"{base_url}/api/files")
         if response.status_code == 200:
             files = response.json()
             print(f"✅ Files loaded: {len(files)} files found")
@@ -53,13 +56,22 @@ def test_web_interface():
         
         # Test log endpoint
         print("5. Testing log endpoint...")
-        response = requests.get(f"{base_url}/api/log")
+        response = session.get(f"{base_url}/api/log")
         if response.status_code == 200:
             log_data = response.text
             print(f"✅ Log loaded: {len(log_data)} characters")
         else:
             print(f"❌ Log failed: {response.status_code}")
         
+        # Test log tail endpoint
+        print("6. Testing log tail endpoint...")
+        response = session.get(f"{base_url}/api/log", params={"tail": 5})
+        if response.status_code == 200:
+            rows = response.text.splitlines()
+            print(f"✅ Log tail loaded: {max(len(rows) - 1, 0)} entries")
+        else:
+            print(f"❌ Log tail failed: {response.status_code}")
+        
         print("\n🎉 All tests completed!")
         print(f"🌐 Web interface is running at: {base_url}")
         print("📱 Open your browser and navigate to the URL above")
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Mindseye Timeline
+Incident-date extraction and a sorted timeline index for date-range queries.
+
+Author: AI Assistant
+Purpose: Show evidence in the order incidents happened, not the order it was compiled
+"""
+
+import json
+import re
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from itertools import groupby
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+TIMELINE_FILENAME = "timeline_index.json"
+
+# Bump when extraction rules change so cached results are re-extracted
+DATE_EXTRACTION_VERSION = 1
+
+_MONTHS = {name: number for number, names in enumerate([
+    ("jan", "january"), ("feb", "february"), ("mar", "march"), ("apr", "april"),
+    ("may",), ("jun", "june"), ("jul", "july"), ("aug", "august"),
+    ("sep", "sept", "september"), ("oct", "october"), ("nov", "november"), ("dec", "december"),
+], 1) for name in names}
+_MONTH = r"(?P<month_name>" + "|".join(sorted(_MONTHS, key=len, reverse=True)) + r")\.?"
+
+# Numeric dates are read day-first (18/01/2025), as in UK and most international records
+_DATE_PATTERNS = [
+    re.compile(r"\b(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})\b"),
+    re.compile(r"\b(?P<day>\d{1,2})[/.](?P<month>\d{1,2})[/.](?P<year>\d{4})\b"),
+    re.compile(_MONTH + r"\s+(?P<day>\d{1,2})(?:st|nd|rd|th)?,?\s+(?P<year>\d{4})\b", re.IGNORECASE),
+    re.compile(r"\b(?P<day>\d{1,2})(?:st|nd|rd|th)?\s+" + _MONTH + r",?\s+(?P<year>\d{4})\b", re.IGNORECASE),
+]
+
+# "Label: value" lines; date labels ("Date:", "Incident Date:") are preferred, and
+# dates of birth, admission and the like are never taken as the incident date
+_LABELLED_LINE = re.compile(r"^\W*(?P<label>[A-Za-z][A-Za-z ]{0,40}):")
+_DATE_LABEL = re.compile(r"\bdate\b", re.IGNORECASE)
+_IGNORED_LABELS = re.compile(r"\b(birth|dob|admission|discharge|review|due|expiry|next)\b", re.IGNORECASE)
+_HEADER_LINES = 40
+
+
+def _parse_date(text: str) -> Optional[date]:
+    """First valid date in a piece of text."""
+    for pattern in _DATE_PATTERNS:
+        for match in pattern.finditer(text):
+            parts = match.groupdict()
+            month = (_MONTHS[parts["month_name"].lower()] if parts.get("month_name")
+                     else int(parts["month"]))
+            try:
+                return date(int(parts["year"]), month, int(parts["day"]))
+            except ValueError:
+                continue
+    return None
+
+
+def extract_incident_date(content: str) -> Optional[str]:
+    """
+    Find when the incident described in a document happened (ISO date).
+
+    A labelled date in the document header ("Date:", "Incident Date:",
+    "Date of Incident:") wins; dates of birth, admission and the like are
+    ignored. Otherwise the first date on any other line is used.
+    Returns None if the text has no date.
+    """
+    lines = content.splitlines()
+    for line in lines[:_HEADER_LINES]:
+        match = _LABELLED_LINE.match(line)
+        if (match and _DATE_LABEL.search(match.group("label"))
+                and not _IGNORED_LABELS.search(match.group("label"))):
+            found = _parse_date(line[match.end():])
+            if found:
+                return found.isoformat()
+    for line in lines:
+        match = _LABELLED_LINE.match(line)
+        if match and _IGNORED_LABELS.search(match.group("label")):
+            continue
+        found = _parse_date(line)
+        if found:
+            return found.isoformat()
+    return None
+
+
+def week_start(day: str) -> str:
+    """Monday of the ISO week containing an ISO date."""
+    parsed = date.fromisoformat(day)
+    return (parsed - timedelta(days=parsed.weekday())).isoformat()
+
+
+def load_timeline(index_file) -> List[List[str]]:
+    """Load the sorted [[date, path], ...] timeline ([] if there is none yet)."""
+    index_file = Path(index_file)
+    if not index_file.exists():
+        return []
+    with open(index_file, 'r', encoding='utf-8') as f:
+        return json.load(f)["entries"]
+
+
+def update_timeline(index_file, documents: Dict[str, str]) -> List[List[str]]:
+    """
+    Replace the dates of the given documents in the timeline and save it atomically.
+
+    Entries stay sorted by (date, path): the new entries are sorted and
+    merged into the existing run in linear time.
+
+    Args:
+        index_file: Path to timeline_index.json
+        documents: {document path: ISO incident date} for documents (re)processed this run
+    """
+    from heapq import merge
+    from evidence_compiler import _write_json_atomic
+
+    kept = [entry for entry in load_timeline(index_file) if entry[1] not in documents]
+    added = sorted([day, path] for path, day in documents.items() if day)
+    entries = list(merge(kept, added))
+    _write_json_atomic(index_file, {"entries": entries}, indent=None)
+    return entries
+
+
+class TimelineIndex:
+    """In-memory view of timeline_index.json for binary-search range queries."""
+
+    def __init__(self, entries: List[List[str]]):
+        self.entries = entries
+        self.dates = [entry[0] for entry in entries]
+
+    @classmethod
+    def load(cls, index_file) -> 'TimelineIndex':
+        return cls(load_timeline(index_file))
+
+    def range(self, start: Optional[str] = None, end: Optional[str] = None) -> Tuple[int, int]:
+        """Slice bounds of the entries dated start..end inclusive (open ends allowed)."""
+        low = bisect_left(self.dates, start) if start else 0
+        high = bisect_right(self.dates, end) if end else len(self.dates)
+        return low, max(low, high)
+
+    def query(self, start: Optional[str] = None, end: Optional[str] = None, bucket: str = "day",
+              limit: int = 1000) -> Dict[str, Any]:
+        """
+        Documents and a histogram for a date range.
+
+        Args:
+            start, end: ISO dates bounding the range (inclusive; None for open)
+            bucket: 'day' or 'week' (weeks start on Monday)
+            limit: Maximum documents to list (the histogram always covers the range)
+        """
+        low, high = self.range(start, end)
+        # Count per day first; weeks are then built from the (far fewer) days
+        counts = [(day, sum(1 for _ in group)) for day, group in groupby(self.dates[low:high])]
+        if bucket == "week":
+            counts = [(week, sum(count for _, count in days))
+                      for week, days in groupby(counts, key=lambda item: week_start(item[0]))]
+        buckets = [{"start": day, "count": count} for day, count in counts]
+        return {
+            "from": start,
+            "to": end,
+            "bucket": bucket,
+            "count": high - low,
+            "buckets": buckets,
+            "documents": [{"date": day, "path": path} for day, path in self.entries[low:min(high, low + limit)]],
+            "truncated": high - low > limit,
+        }
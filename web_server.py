@@ -7,25 +7,156 @@ Author: AI Assistant
 Purpose: Web interface for Mindseye evidence compilation system
 """
 
-import os
+import re
+import html
 import json
-import csv
+import mimetypes
+import threading
+from email.utils import formatdate, parsedate_to_datetime
 from pathlib import Path
 from datetime import datetime
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import urlparse, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs, unquote
 import logging
 
-# Import our evidence compiler
-from evidence_compiler import MindseyeEvidenceCompiler
+from log_index import AuditLogIndex
+from mindseye_config import load_config
+
+# The compiler, extractors and Merkle modules are imported by the handlers
+# that use them, so the server is listening before they are loaded.
+
+# Persistent connection limits
+KEEP_ALIVE_TIMEOUT = 15
+MAX_REQUESTS_PER_CONNECTION = 100
+
+# Compilations write shared output files, so only one runs at a time
+_compile_lock = threading.Lock()
+
+# State of the background verification job served by /api/verify
+_verify_job = {"status": "idle"}
+_verify_job_lock = threading.Lock()
+
+# Parsed timeline index, reloaded only when the file changes
+_timeline_cache = {}
+_timeline_cache_lock = threading.Lock()
+ISO_DATE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+# Evidence roots tried in order; the first that exists is used
+EVIDENCE_ROOTS = [Path("example_evidence"), Path("evidence"), Path("/evidence")]
+
+# Images are keyed by evidence filename and rarely change; the page itself
+# must be revalidated so UI updates are picked up
+LONG_CACHE = 'public, max-age=31536000'
+REVALIDATE_CACHE = 'no-cache'
+
+
+def find_evidence_root():
+    """Return the first existing evidence root, or None."""
+    for evidence_root in EVIDENCE_ROOTS:
+        if evidence_root.exists():
+            return evidence_root
+    return None
+
+def configured_output_dir():
+    """The configured compiler output directory (bubbles, log, stats, indexes, thumbnails)."""
+    return Path(load_config()["default_output_dir"])
+
+def compiled_evidence_root():
+    """The evidence root of the last compilation (from the stats sidecar), else the configured default."""
+    from evidence_compiler import load_stats_sidecar
+    
+    sidecar = load_stats_sidecar(configured_output_dir())
+    return Path(sidecar.get("evidence_root") or load_config()["default_evidence_root"])
+
+def list_evidence_files(evidence_root, file_types):
+    """Describe the supported evidence files under a root, as served by /api/files."""
+    files = []
+    for file_path in Path(evidence_root).rglob("*"):
+        if file_path.is_file() and file_path.suffix.lower() in file_types:
+            stat = file_path.stat()
+            files.append({
+                'name': file_path.name,
+                'path': str(file_path.relative_to(evidence_root)),
+                'size': stat.st_size,
+                'extension': file_path.suffix[1:],
+                'modified': datetime.fromtimestamp(stat.st_mtime).isoformat()
+            })
+    return files
 
 class MindseyeWebHandler(BaseHTTPRequestHandler):
-    """HTTP request handler for Mindseye web interface."""
+    """
+    HTTP request handler for Mindseye web interface.
+    
+    Speaks HTTP/1.1 with persistent connections: every response carries a
+    Content-Length, idle connections are closed after KEEP_ALIVE_TIMEOUT
+    seconds and each connection serves at most MAX_REQUESTS_PER_CONNECTION
+    requests.
+    """
+    
+    protocol_version = 'HTTP/1.1'
+    timeout = KEEP_ALIVE_TIMEOUT
     
     def __init__(self, *args, **kwargs):
         self.compiler = None
+        self.requests_handled = 0
+        self.response_started = False
         super().__init__(*args, **kwargs)
     
+    def handle_one_request(self):
+        """Handle one request, tracking the per-connection request count."""
+        self.response_started = False
+        self.requests_handled += 1
+        super().handle_one_request()
+    
+    def end_headers(self):
+        """Advertise keep-alive limits, closing once the request limit is reached."""
+        if self.requests_handled >= MAX_REQUESTS_PER_CONNECTION:
+            self.send_header('Connection', 'close')
+        elif not self.close_connection:
+            self.send_header('Keep-Alive', f'timeout={KEEP_ALIVE_TIMEOUT}, max={MAX_REQUESTS_PER_CONNECTION - self.requests_handled}')
+        self.response_started = True
+        super().end_headers()
+    
+    def send_error(self, code, message=None, explain=None):
+        """
+        Send an error response with an accurate Content-Length.
+        
+        Unlike the base class this keeps the connection alive. If a response
+        is already under way another one cannot be sent, so the connection
+        is closed instead.
+        """
+        if self.response_started:
+            self.close_connection = True
+            return
+        if not self.command:
+            # The request itself could not be parsed; let the base class close
+            super().send_error(code, message, explain)
+            return
+        
+        short, long = self.responses.get(code, ('???', '???'))
+        message = message or short
+        explain = explain or long
+        self.log_error("code %d, message %s", code, message)
+        self.send_response(code, message)
+        
+        body = b''
+        if code >= 200 and code not in (204, 304):
+            body = (self.error_message_format % {
+                'code': code,
+                'message': html.escape(message, quote=False),
+                'explain': html.escape(explain, quote=False)
+            }).encode('utf-8', 'replace')
+            self.send_header('Content-Type', self.error_content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD' and body:
+            self.wfile.write(body)
+    
+    def read_request_body(self) -> bytes:
+        """Read the request body so the connection can be reused."""
+        content_length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(content_length) if content_length > 0 else b''
+    
     def do_GET(self):
         """Handle GET requests."""
         parsed_path = urlparse(self.path)
@@ -34,14 +165,25 @@ class MindseyeWebHandler(BaseHTTPRequestHandler):
         try:
             if path == '/' or path == '/index.html':
                 self.serve_index()
+            elif path.startswith('/images/'):
+                # Bubble image paths are relative to the root they were compiled from
+                self.serve_static_under(compiled_evidence_root() / "images", path[len('/images/'):])
+            elif path.startswith('/thumbnails/'):
+                self.serve_static_under(configured_output_dir() / "thumbnails", path[len('/thumbnails/'):])
             elif path == '/api/stats':
                 self.serve_stats()
             elif path == '/api/bubbles':
                 self.serve_bubbles()
             elif path == '/api/log':
-                self.serve_log()
+                self.serve_log(parse_qs(parsed_path.query))
             elif path == '/api/files':
                 self.serve_files()
+            elif path == '/api/verify':
+                self.serve_verify(parse_qs(parsed_path.query))
+            elif path == '/api/tags':
+                self.serve_tags(parse_qs(parsed_path.query))
+            elif path == '/api/timeline':
+                self.serve_timeline(parse_qs(parsed_path.query))
             else:
                 self.send_error(404, "Not Found")
         except Exception as e:
@@ -53,10 +195,13 @@ class MindseyeWebHandler(BaseHTTPRequestHandler):
         path = parsed_path.path
         
         try:
+            body = self.read_request_body()
             if path == '/api/compile':
-                self.handle_compile()
+                self.handle_compile(body)
             elif path == '/api/clear-log':
                 self.handle_clear_log()
+            elif path == '/api/verify':
+                self.handle_verify(body)
             else:
                 self.send_error(404, "Not Found")
         except Exception as e:
@@ -64,26 +209,91 @@ class MindseyeWebHandler(BaseHTTPRequestHandler):
     
     def serve_index(self):
         """Serve the main HTML page."""
-        try:
-            with open('index.html', 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            self.send_response(200)
-            self.send_header('Content-Type', 'text/html; charset=utf-8')
-            self.end_headers()
-            self.wfile.write(content.encode('utf-8'))
-        except FileNotFoundError:
+        index_file = Path('index.html')
+        if not index_file.is_file():
             self.send_error(404, "index.html not found")
+            return
+        self.serve_static(index_file, REVALIDATE_CACHE, 'text/html; charset=utf-8')
+    
+    def serve_static_under(self, base_dir, relative_path):
+        """Serve a file from base_dir, refusing paths that escape it."""
+        if base_dir is None:
+            self.send_error(404, "Not Found")
+            return
+        base_dir = base_dir.resolve()
+        file_path = (base_dir / unquote(relative_path)).resolve()
+        if base_dir not in file_path.parents or not file_path.is_file():
+            self.send_error(404, "Not Found")
+            return
+        self.serve_static(file_path, LONG_CACHE)
+    
+    def serve_static(self, file_path, cache_control, content_type=None):
+        """
+        Serve a static file with validators, conditional and range support.
+        
+        Answers 304 for matching If-None-Match / If-Modified-Since requests
+        and 206 for satisfiable single ranges; bodies are streamed via
+        send_file.
+        """
+        stat = file_path.stat()
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+        last_modified = formatdate(stat.st_mtime, usegmt=True)
+        headers = {
+            'Content-Type': content_type or mimetypes.guess_type(str(file_path))[0] or 'application/octet-stream',
+            'Cache-Control': cache_control,
+            'ETag': etag,
+            'Last-Modified': last_modified,
+            'Accept-Ranges': 'bytes',
+        }
+        
+        if self.is_not_modified(etag, stat.st_mtime):
+            self.send_response(304)
+            for name in ('Cache-Control', 'ETag', 'Last-Modified'):
+                self.send_header(name, headers[name])
+            self.end_headers()
+            return
+        
+        size = stat.st_size
+        if_range = self.headers.get('If-Range')
+        byte_range = self.parse_range(size) if not if_range or if_range == etag else None
+        if byte_range is None:
+            self.send_file(file_path, 0, size, headers)
+        elif byte_range is False:
+            self.send_response(416)
+            self.send_header('Content-Range', f'bytes */{size}')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+        else:
+            start, end = byte_range
+            headers['Content-Range'] = f'bytes {start}-{end}/{size}'
+            self.send_file(file_path, start, end - start + 1, headers, status=206)
+    
+    def is_not_modified(self, etag, mtime):
+        """Evaluate If-None-Match / If-Modified-Since against a file's validators."""
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match:
+            candidates = [tag.strip() for tag in if_none_match.split(',')]
+            return '*' in candidates or etag in candidates or f'W/{etag}' in candidates
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since:
+            try:
+                return int(mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
     
     def serve_stats(self):
         """Serve compilation statistics."""
+        from evidence_compiler import read_compilation_stats
+        
         try:
-            # Initialize compiler with default paths
-            compiler = MindseyeEvidenceCompiler()
-            stats = compiler.get_compilation_stats()
+            # Read the compiler's stats sidecar for the default paths
+            config = load_config()
+            evidence_root = Path(config["default_evidence_root"])
+            stats = read_compilation_stats(configured_output_dir(), evidence_root)
             
             # Add additional stats
-            stats['evidence_root'] = str(compiler.evidence_root)
+            stats['evidence_root'] = str(evidence_root)
             stats['last_compilation'] = self.get_last_compilation_time()
             
             self.send_json_response(stats)
@@ -93,7 +303,7 @@ class MindseyeWebHandler(BaseHTTPRequestHandler):
     def serve_bubbles(self):
         """Serve bubbles JSON data."""
         try:
-            bubbles_file = Path("bubbles.json")
+            bubbles_file = configured_output_dir() / "bubbles.json"
             if bubbles_file.exists():
                 with open(bubbles_file, 'r', encoding='utf-8') as f:
                     bubbles = json.load(f)
@@ -103,66 +313,140 @@ class MindseyeWebHandler(BaseHTTPRequestHandler):
         except Exception as e:
             self.send_error(500, f"Error loading bubbles: {str(e)}")
     
-    def serve_log(self):
-        """Serve compilation log as CSV."""
+    def serve_log(self, query=None):
+        """
+        Serve compilation log as CSV.
+
+        Supports ?tail=N (last N rows), ?since=<timestamp> (rows logged at or
+        after the timestamp) and single byte-range requests; the file is
+        streamed rather than read into memory.
+        """
+        query = query or {}
         try:
-            log_file = Path("compiler_log.csv")
-            if log_file.exists():
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                self.send_response(200)
-                self.send_header('Content-Type', 'text/csv; charset=utf-8')
-                self.send_header('Content-Disposition', 'attachment; filename="compiler_log.csv"')
+            log_file = configured_output_dir() / "compiler_log.csv"
+            if not log_file.exists():
+                self.send_error(404, "No log file found")
+                return
+            
+            index = AuditLogIndex(log_file)
+            index.refresh()
+            size = log_file.stat().st_size
+            
+            headers = {
+                'Content-Type': 'text/csv; charset=utf-8',
+                'Content-Disposition': 'attachment; filename="compiler_log.csv"',
+                'Accept-Ranges': 'bytes',
+            }
+            
+            if 'tail' in query or 'since' in query:
+                if 'tail' in query:
+                    start = index.tail_offset(int(query['tail'][0]))
+                else:
+                    start = index.since_offset(query['since'][0])
+                prefix = index.header_bytes()
+                if start < len(prefix):
+                    prefix = b''
+                self.send_file(log_file, start, size - start, headers, prefix=prefix)
+                return
+            
+            byte_range = self.parse_range(size)
+            if byte_range is None:
+                self.send_file(log_file, 0, size, headers)
+            elif byte_range is False:
+                self.send_response(416)
+                self.send_header('Content-Range', f'bytes */{size}')
+                self.send_header('Content-Length', '0')
                 self.end_headers()
-                self.wfile.write(content.encode('utf-8'))
             else:
-                self.send_error(404, "No log file found")
+                start, end = byte_range
+                headers['Content-Range'] = f'bytes {start}-{end}/{size}'
+                self.send_file(log_file, start, end - start + 1, headers, status=206)
+        except ValueError:
+            self.send_error(400, "Invalid log query")
         except Exception as e:
             self.send_error(500, f"Error loading log: {str(e)}")
     
+    def parse_range(self, size):
+        """
+        Parse a single-range Range header.
+        
+        Returns:
+            (start, end) inclusive, None if absent or ignorable, False if unsatisfiable
+        """
+        header = self.headers.get('Range')
+        if not header:
+            return None
+        match = re.fullmatch(r'bytes=(\d*)-(\d*)', header.strip())
+        if not match or match.group(1) == match.group(2) == '':
+            return None
+        first, last = match.groups()
+        if first == '':
+            length = int(last)
+            if length == 0:
+                return False
+            start, end = max(size - length, 0), size - 1
+        else:
+            start = int(first)
+            end = min(int(last), size - 1) if last else size - 1
+        if start >= size or start > end:
+            return False
+        return start, end
+    
+    def send_file(self, file_path, offset, length, headers, status=200, prefix=b''):
+        """
+        Stream part of a file to the client.
+        
+        socket.sendfile is zero-copy (os.sendfile) where available and waits
+        for the socket to drain, which the keep-alive timeout makes
+        non-blocking; elsewhere it falls back to copying.
+        """
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(prefix) + length))
+        self.end_headers()
+        if self.command == 'HEAD':
+            return
+        if prefix:
+            self.wfile.write(prefix)
+        
+        if length > 0:
+            with open(file_path, 'rb') as f:
+                self.connection.sendfile(f, offset, length)
+    
     def serve_files(self):
         """Serve list of evidence files."""
+        from extractors import supported_extensions
+        
         try:
             # Try example_evidence first, then fall back to evidence
-            evidence_roots = [Path("example_evidence"), Path("evidence"), Path("/evidence")]
-            files = []
-            
-            for evidence_root in evidence_roots:
-                if evidence_root.exists():
-                    for file_path in evidence_root.rglob("*"):
-                        if file_path.is_file() and file_path.suffix.lower() in ['.txt', '.md']:
-                            files.append({
-                                'name': file_path.name,
-                                'path': str(file_path.relative_to(evidence_root)),
-                                'size': file_path.stat().st_size,
-                                'extension': file_path.suffix[1:],
-                                'modified': datetime.fromtimestamp(file_path.stat().st_mtime).isoformat()
-                            })
-                    break  # Use the first found evidence directory
+            evidence_root = find_evidence_root()
+            file_types = supported_extensions(load_config()["supported_file_types"])
+            files = list_evidence_files(evidence_root, file_types) if evidence_root else []
             
             self.send_json_response(files)
         except Exception as e:
             self.send_error(500, f"Error scanning files: {str(e)}")
     
-    def handle_compile(self):
+    def handle_compile(self, body=b''):
         """Handle evidence compilation request."""
+        from evidence_compiler import MindseyeEvidenceCompiler
+        
         try:
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode('utf-8'))
-            
-            evidence_root = data.get('evidence_root', '/evidence')
-            output_dir = data.get('output_dir', '.')
+            data = json.loads(body.decode('utf-8')) if body else {}
             
-            # Initialize compiler
-            compiler = MindseyeEvidenceCompiler(evidence_root, output_dir)
+            config = load_config()
+            evidence_root = data.get('evidence_root', config["default_evidence_root"])
+            output_dir = data.get('output_dir', config["default_output_dir"])
             
-            # Run compilation
-            success = compiler.compile_evidence()
+            # The compiler reads the processed-file log when constructed, so it
+            # is built under the lock to see what an earlier request logged
+            with _compile_lock:
+                compiler = MindseyeEvidenceCompiler(evidence_root, output_dir)
+                success = compiler.compile_evidence()
+                stats = compiler.get_compilation_stats() if success else {}
             
             if success:
-                stats = compiler.get_compilation_stats()
                 response = {
                     'success': True,
                     'message': 'Compilation completed successfully',
@@ -179,12 +463,129 @@ class MindseyeWebHandler(BaseHTTPRequestHandler):
         except Exception as e:
             self.send_error(500, f"Error during compilation: {str(e)}")
     
+    def serve_timeline(self, query):
+        """
+        Serve documents by incident date.
+        
+        ?from=YYYY-MM-DD&to=YYYY-MM-DD (inclusive, either optional),
+        ?bucket=day|week for the histogram and ?limit= for the document list.
+        """
+        from timeline import TIMELINE_FILENAME, TimelineIndex
+        
+        start = query.get('from', [None])[0]
+        end = query.get('to', [None])[0]
+        bucket = query.get('bucket', ['day'])[0]
+        try:
+            limit = int(query.get('limit', ['1000'])[0])
+        except ValueError:
+            limit = -1
+        if any(value and not ISO_DATE.match(value) for value in (start, end)):
+            self.send_error(400, "from and to must be dates in YYYY-MM-DD form")
+            return
+        if bucket not in ('day', 'week') or limit < 0:
+            self.send_error(400, "bucket must be day or week and limit a non-negative integer")
+            return
+        
+        index_file = configured_output_dir() / TIMELINE_FILENAME
+        try:
+            stat = index_file.stat()
+            version = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            version = None
+        with _timeline_cache_lock:
+            cached = _timeline_cache.get(index_file)
+            if cached is None or cached[0] != version:
+                cached = (version, TimelineIndex.load(index_file) if version else TimelineIndex([]))
+                _timeline_cache[index_file] = cached
+        self.send_json_response(cached[1].query(start, end, bucket, limit))
+    
+    def serve_tags(self, query):
+        """
+        Serve the tag -> documents index.
+        
+        ?tag=medications:Morphine returns one tag's documents and
+        ?category=medications limits the index to one dictionary.
+        """
+        from tagging import TAG_INDEX_FILENAME, load_tag_index
+        
+        index = load_tag_index(configured_output_dir() / TAG_INDEX_FILENAME)
+        if 'tag' in query:
+            tag = query['tag'][0]
+            self.send_json_response({'tag': tag, 'documents': index.get(tag, [])})
+            return
+        if 'category' in query:
+            prefix = query['category'][0] + ':'
+            index = {tag: documents for tag, documents in index.items() if tag.startswith(prefix)}
+        self.send_json_response(index)
+    
+    def serve_verify(self, query):
+        """Serve the verification job state, or an inclusion proof with ?path=."""
+        from merkle import inclusion_proof
+        
+        if 'path' in query:
+            try:
+                proof = inclusion_proof(configured_output_dir(), query['path'][0])
+            except ValueError as e:
+                self.send_error(404, str(e))
+                return
+            except KeyError:
+                self.send_error(404, "File not in the published Merkle tree")
+                return
+            self.send_json_response(proof)
+            return
+        with _verify_job_lock:
+            job = dict(_verify_job)
+        self.send_json_response(job)
+    
+    def handle_verify(self, body=b''):
+        """Start a background verification of the evidence against the published root."""
+        from merkle import verify_corpus
+        
+        data = json.loads(body.decode('utf-8')) if body else {}
+        config = load_config()
+        evidence_root = data.get('evidence_root', config["default_evidence_root"])
+        output_dir = data.get('output_dir', config["default_output_dir"])
+        
+        with _verify_job_lock:
+            if _verify_job["status"] == "running":
+                self.send_json_response(dict(_verify_job), 409)
+                return
+            _verify_job.clear()
+            _verify_job.update(status="running", started=datetime.now().isoformat())
+            job = dict(_verify_job)
+        
+        def run():
+            try:
+                # Verification must not see a half-written compile
+                with _compile_lock:
+                    report = verify_corpus(evidence_root, output_dir, data.get('prefix', ''),
+                                           data.get('expected_root'))
+                update = {"status": "done", "result": report}
+            except Exception as e:
+                update = {"status": "error", "error": str(e)}
+            with _verify_job_lock:
+                _verify_job.update(update, finished=datetime.now().isoformat())
+        
+        threading.Thread(target=run, daemon=True).start()
+        self.send_json_response(job, 202)
+    
     def handle_clear_log(self):
         """Handle log clearing request."""
+        from evidence_compiler import STATS_FILENAME
+        
         try:
-            log_file = Path("compiler_log.csv")
-            if log_file.exists():
-                log_file.unlink()
+            # Not while a compilation is appending to the log
+            with _compile_lock:
+                log_file = configured_output_dir() / "compiler_log.csv"
+                if log_file.exists():
+                    log_file.unlink()
+                AuditLogIndex(log_file).refresh()
+                
+                # Processed-file counts are no longer valid; the sidecar is
+                # rebuilt from the remaining outputs on the next stats read
+                stats_file = configured_output_dir() / STATS_FILENAME
+                if stats_file.exists():
+                    stats_file.unlink()
             
             response = {
                 'success': True,
@@ -198,27 +599,26 @@ class MindseyeWebHandler(BaseHTTPRequestHandler):
             }
             self.send_json_response(response)
     
-    def send_json_response(self, data):
+    def send_json_response(self, data, status=200):
         """Send JSON response."""
-        self.send_response(200)
+        json_data = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        
+        self.send_response(status)
         self.send_header('Content-Type', 'application/json; charset=utf-8')
-        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Content-Length', str(len(json_data)))
+        if load_config()["web_server"]["enable_cors"]:
+            self.send_header('Access-Control-Allow-Origin', '*')
         self.end_headers()
-        
-        json_data = json.dumps(data, indent=2, ensure_ascii=False)
-        self.wfile.write(json_data.encode('utf-8'))
+        self.wfile.write(json_data)
     
     def get_last_compilation_time(self):
         """Get the timestamp of the last compilation."""
+        from evidence_compiler import load_stats_sidecar
+        
         try:
-            log_file = Path("compiler_log.csv")
-            if log_file.exists():
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    rows = list(reader)
-                    if rows:
-                        return rows[-1].get('timestamp', 'Unknown')
-            return 'Never'
+            if not (configured_output_dir() / "compiler_log.csv").exists():
+                return 'Never'
+            return load_stats_sidecar(configured_output_dir()).get('last_compilation', 'Never')
         except:
             return 'Unknown'
     
@@ -227,14 +627,27 @@ class MindseyeWebHandler(BaseHTTPRequestHandler):
         pass
 
 
-def run_server(host='localhost', port=8080):
-    """Run the web server."""
+def run_server(host=None, port=None, open_browser=False):
+    """
+    Run the web server (host and port default to config.json's web_server settings).
+    
+    With open_browser the dashboard is opened as soon as the socket is
+    listening; early requests wait in the listen backlog.
+    """
+    config = load_config()
+    host = host or config["web_server"]["default_host"]
+    port = port or config["web_server"]["default_port"]
     server_address = (host, port)
-    httpd = HTTPServer(server_address, MindseyeWebHandler)
+    httpd = ThreadingHTTPServer(server_address, MindseyeWebHandler)
+    httpd.daemon_threads = True
+    
+    if open_browser:
+        import webbrowser
+        threading.Thread(target=webbrowser.open, args=(f"http://{host}:{port}",), daemon=True).start()
     
     print(f"🧠 Mindseye Evidence Compiler Web Server")
     print(f"🌐 Server running at http://{host}:{port}")
-    print(f"📁 Evidence root: /evidence")
+    print(f"📁 Evidence root: {config['default_evidence_root']}")
     print(f"📄 Open your browser and navigate to the URL above")
     print(f"⏹️  Press Ctrl+C to stop the server")
     print("-" * 50)
@@ -251,8 +664,8 @@ def main():
     import argparse
     
     parser = argparse.ArgumentParser(description="Mindseye Evidence Compiler Web Server")
-    parser.add_argument("--host", default="localhost", help="Host to bind to")
-    parser.add_argument("--port", type=int, default=8080, help="Port to bind to")
+    parser.add_argument("--host", default=None, help="Host to bind to (default: from config.json)")
+    parser.add_argument("--port", type=int, default=None, help="Port to bind to (default: from config.json)")
     
     args = parser.parse_args()
     